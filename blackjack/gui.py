@@ -61,6 +61,8 @@ class BlackjackApp:
         self.theme_var = tk.StringVar(value="default")
         self.show_totals = tk.BooleanVar(value=True)
         self.show_hint = tk.BooleanVar(value=True)
+        # Placeholder until blackjack has sound; one var so the reused options checkbox stays bound to it.
+        self.sound_cues = tk.BooleanVar(value=False)
         self._language = "en"
         self.language_names = {
             "en": "English",
@@ -767,11 +769,11 @@ class BlackjackApp:
 
     # Shared options integration (minimal toggles for now)
     def _show_options(self) -> None:
-        self._apply_options_styles()
+        # Options styles are (re)configured by _apply_theme at startup and on every theme change.
         toggles = [
-            ("Sound cues", tk.BooleanVar(value=False), lambda: None),
-            ("Show totals", self.show_totals, self._refresh_ui),
-            ("Show hints", self.show_hint, self._save_settings),
+            ("Sound cues", "sound_cues", lambda: None),
+            ("Show totals", "show_totals", "_refresh_ui"),
+            ("Show hints", "show_hint", "_save_settings"),
         ]
         presets: list[tuple[str, callable]] = []
         shared_options.show_options_popup(
@@ -950,7 +952,7 @@ class BlackjackApp:
         popup = getattr(self, "options_popup", None)
         if not popup or not popup.winfo_exists():
             return
-        popup.configure(bg=self._color("BG"))
+        popup.restyle()
 
 
 def _notify_already_running() -> None:
@@ -10,21 +10,87 @@ import json
 import os
 import subprocess
 import sys
+import time
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import messagebox, ttk
 from typing import Iterable, List, Optional
 
-from shared.options import PALETTES
 from shared import settings, single_instance, audio
 
-LOCALES_DIR = Path(__file__).resolve().parent / "shared" / "locales"
-SETTINGS_FILE = Path(__file__).resolve().parent / "data" / "launcher_settings.json"
-ACTIVE_GAME_LOCK = Path(__file__).resolve().parent / "data" / "locks" / "active_game.lock"
+_MODULE_DIR = Path(__file__).resolve().parent
+LOCALES_DIR = _MODULE_DIR / "shared" / "locales"
+SETTINGS_FILE = _MODULE_DIR / "data" / "launcher_settings.json"
+ACTIVE_GAME_LOCK = _MODULE_DIR / "data" / "locks" / "active_game.lock"
+# How long an active-lock probe result is reused before touching the lock file again.
+LOCK_PROBE_TTL = 0.5
 
+# Locale codes found under LOCALES_DIR; the set is fixed for the life of the process.
+_LANG_CODES_CACHE: Optional[list[str]] = None
 
-@dataclass
+# Parsed locale files keyed by path, tagged with the mtime they were read at.
+_LOCALE_CACHE: dict[Path, tuple[float, dict]] = {}
+
+# Formatted _t results for calls with kwargs, keyed by (text, sorted kwargs); reset whenever
+# a locale file is (re)parsed so edited strings never serve a stale rendering.
+_FORMAT_CACHE: dict[tuple, str] = {}
+
+
+def _read_locale(path: Path) -> Optional[dict]:
+    """Return the parsed locale at ``path``, re-reading only when the file changed on disk."""
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    cached = _LOCALE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        # json.loads detects UTF-8 from bytes, skipping a separate decode step.
+        data = json.loads(path.read_bytes())
+    except Exception:
+        return None
+    _LOCALE_CACHE[path] = (mtime, data)
+    _FORMAT_CACHE.clear()
+    return data
+
+
+def _ttk_theme_settings(
+    bg: str, panel: str, text: str, muted: str, accent: str, card: str, border: str, btn: str
+) -> dict[str, dict]:
+    """``ttk.Style.theme_create`` settings for the launcher styles in one palette."""
+    return {
+        "App.TFrame": {"configure": {"background": bg}},
+        "Hero.TFrame": {"configure": {"background": panel}},
+        "HeroTitle.TLabel": {"configure": {"background": panel, "foreground": text, "font": ("Segoe UI", 18, "bold")}},
+        "HeroMuted.TLabel": {"configure": {"background": panel, "foreground": muted, "font": ("Segoe UI", 10)}},
+        "Badge.TLabel": {"configure": {"background": accent, "foreground": bg, "padding": (12, 6), "font": ("Segoe UI", 10, "bold")}},
+        "BadgeMuted.TLabel": {
+            "configure": {"background": border, "foreground": text, "padding": (12, 6), "font": ("Segoe UI", 10, "bold")}
+        },
+        "Card.TFrame": {"configure": {"background": card, "borderwidth": 0, "relief": "flat"}},
+        "CardInner.TFrame": {"configure": {"background": card}},
+        "CardHeading.TLabel": {"configure": {"background": card, "foreground": text, "font": ("Segoe UI", 14, "bold")}},
+        "CardText.TLabel": {"configure": {"background": card, "foreground": muted, "wraplength": 460, "font": ("Segoe UI", 10)}},
+        "Path.TLabel": {"configure": {"background": card, "foreground": muted, "font": ("Segoe UI", 9)}},
+        "Status.TLabel": {"configure": {"background": accent, "foreground": bg, "font": ("Segoe UI", 10, "bold"), "padding": (10, 4)}},
+        "DisabledStatus.TLabel": {
+            "configure": {"background": border, "foreground": text, "font": ("Segoe UI", 10, "bold"), "padding": (10, 4)}
+        },
+        "Launch.TButton": {
+            "configure": {"padding": (12, 8), "background": btn, "foreground": bg, "borderwidth": 0, "relief": "flat"},
+            "map": {
+                "background": [("active", accent), ("disabled", card)],
+                "foreground": [("active", bg), ("disabled", muted)],
+            },
+        },
+        "Separator.TFrame": {"configure": {"background": bg}},
+        "TSeparator": {"configure": {"background": border}},
+    }
+
+
+@dataclass(slots=True)
 class GameEntry:
     """Describe a playable game that can be launched from the hub."""
 
@@ -34,15 +100,17 @@ class GameEntry:
     name_key: Optional[str] = None
     desc_key: Optional[str] = None
     extra_args: Optional[List[str]] = None
+    # Resolved once at construction: renders read these many times, the script rarely appears mid-session.
+    available: bool = field(init=False, repr=False, compare=False)
+    command: List[str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def available(self) -> bool:
-        return self.script_path.exists()
-
-    @property
-    def command(self) -> List[str]:
+    def __post_init__(self) -> None:
+        self.available = self.script_path.is_file()
         args: Iterable[str] = self.extra_args or []
-        return [sys.executable, str(self.script_path), *args]
+        # Run as ``-m <stem>`` from the script's folder (see _launch_game's cwd): same sys.path[0]
+        # as running the file, but the module is loaded through the import system so its
+        # bytecode is cached in __pycache__ instead of being recompiled on every launch.
+        self.command = [sys.executable, "-m", self.script_path.stem, *args]
 
 
 class GameLauncherApp:
@@ -55,7 +123,7 @@ class GameLauncherApp:
         self.root.rowconfigure(1, weight=0)
         self.root.rowconfigure(2, weight=1)
 
-        self.project_root = Path(__file__).resolve().parent
+        self.project_root = _MODULE_DIR
         self.games = self._load_games()
         self.language_names = {
             "en": "English",
@@ -68,90 +136,81 @@ class GameLauncherApp:
             "ja": "Nihongo",
             "no": "Norsk (Bokmal)",
         }
+        self._display_to_code = {label: code for code, label in self.language_names.items()}
         self.available_languages = self._discover_languages()
         default_lang = "en" if "en" in self.available_languages else (self.available_languages[0] if self.available_languages else "en")
         defaults = {"language": default_lang, "theme": "default"}
         loaded = settings.load_settings(SETTINGS_FILE, defaults)
         self.language_var = tk.StringVar(value=self._lang_display(loaded.get("language", default_lang)))
         self.language = loaded.get("language", default_lang)
+        # Deferred so `import launcher` (and the no-Tk error path) skips loading the options module.
+        from shared.options import PALETTES
+
+        self._palettes = PALETTES
         self.theme_var = tk.StringVar(value=loaded.get("theme", "default"))
         self.sound_enabled = tk.BooleanVar(value=loaded.get("sound", True))
-        self.click_player = audio.ClickPlayer()
+        # Created on the first audible click; muted sessions never build one.
+        self.click_player: Optional[audio.ClickPlayer] = None
+        self._lock_cache: Optional[tuple[float, Optional[str]]] = None
+        self._applied_theme: Optional[str] = None
+        self.palette: dict[str, str] = {}
+        # Palette name -> ttk theme created for it by _apply_theme.
+        self._ttk_themes: dict[str, str] = {}
+        # Environment snapshot for launched games; per-launch keys are overlaid on top.
+        self._base_env = os.environ.copy()
         self.translations: dict[str, str] = {}
         self._load_translations(self.language)
 
         self._desc_labels: list[ttk.Label] = []
-        self._render_ui()
+        self._resize_after: Optional[str] = None
+        self._build_ui_once()
         self.root.bind("<Configure>", self._on_resize)
 
     def _palette(self) -> dict[str, str]:
-        return PALETTES.get(self.theme_var.get(), PALETTES.get("default", {}))
+        palettes = self._palettes
+        return palettes.get(self.theme_var.get(), palettes.get("default", {}))
 
     def _color(self, key: str) -> str:
-        return self._palette().get(key, "#0f172a")
+        # self.palette is resolved by _apply_theme, so this skips the theme_var Tcl round trip.
+        return self.palette.get(key, "#0f172a")
 
     def _apply_theme(self) -> None:
-        self.root.configure(bg=self._color("BG"))
-        style = ttk.Style(self.root)
-        style.theme_use("clam")
-        style.configure("App.TFrame", background=self._color("BG"))
-        style.configure("Hero.TFrame", background=self._color("PANEL"))
-        style.configure("HeroTitle.TLabel", background=self._color("PANEL"), foreground=self._color("TEXT"), font=("Segoe UI", 18, "bold"))
-        style.configure("HeroMuted.TLabel", background=self._color("PANEL"), foreground=self._color("MUTED"), font=("Segoe UI", 10))
-        style.configure("Badge.TLabel", background=self._color("ACCENT"), foreground=self._color("BG"), padding=(12, 6), font=("Segoe UI", 10, "bold"))
-        style.configure("BadgeMuted.TLabel", background=self._color("BORDER"), foreground=self._color("TEXT"), padding=(12, 6), font=("Segoe UI", 10, "bold"))
-        style.configure("Card.TFrame", background=self._color("CARD"), borderwidth=0, relief="flat")
-        style.configure("CardInner.TFrame", background=self._color("CARD"))
-        style.configure("CardHeading.TLabel", background=self._color("CARD"), foreground=self._color("TEXT"), font=("Segoe UI", 14, "bold"))
-        style.configure("CardText.TLabel", background=self._color("CARD"), foreground=self._color("MUTED"), wraplength=460, font=("Segoe UI", 10))
-        style.configure("Path.TLabel", background=self._color("CARD"), foreground=self._color("MUTED"), font=("Segoe UI", 9))
-        style.configure("Status.TLabel", background=self._color("ACCENT"), foreground=self._color("BG"), font=("Segoe UI", 10, "bold"), padding=(10, 4))
-        style.configure("DisabledStatus.TLabel", background=self._color("BORDER"), foreground=self._color("TEXT"), font=("Segoe UI", 10, "bold"), padding=(10, 4))
-        style.configure(
-            "Launch.TButton",
-            padding=(12, 8),
-            background=self._color("BTN"),
-            foreground=self._color("BG"),
-            borderwidth=0,
-            relief="flat",
-        )
-        style.map(
-            "Launch.TButton",
-            background=[("active", self._color("ACCENT")), ("disabled", self._color("CARD"))],
-            foreground=[("active", self._color("BG")), ("disabled", self._color("MUTED"))],
+        theme = self.theme_var.get()
+        if theme == self._applied_theme:
+            # Language-only refresh: styles are already configured for this palette.
+            return
+        pal = self.palette = self._palette()
+        bg, panel, text, muted, accent, card, border, btn = (
+            pal.get(k, "#0f172a") for k in ("BG", "PANEL", "TEXT", "MUTED", "ACCENT", "CARD", "BORDER", "BTN")
         )
-        style.configure("Separator.TFrame", background=self._color("BG"))
-        style.configure("TSeparator", background=self._color("BORDER"))
+        self.root.configure(bg=bg)
+        style = ttk.Style(self.root)
+        # Each palette becomes its own clam-derived ttk theme, created on first use; switching
+        # back to a palette is then a single theme_use instead of re-configuring every style.
+        ttk_theme = self._ttk_themes.get(theme)
+        if ttk_theme is None:
+            ttk_theme = f"launcher_{len(self._ttk_themes)}"
+            style.theme_create(ttk_theme, parent="clam", settings=_ttk_theme_settings(bg, panel, text, muted, accent, card, border, btn))
+            self._ttk_themes[theme] = ttk_theme
+        style.theme_use(ttk_theme)
+        self._applied_theme = theme
 
     def _build_header(self) -> ttk.Frame:
         container = ttk.Frame(self.root, padding=16, style="Hero.TFrame")
 
-        title = ttk.Label(container, text=self._t("launcher.title", "Arcade Hub"), style="HeroTitle.TLabel")
-        self.subtitle_label = ttk.Label(
-            container,
-            text=self._t(
-                "launcher.subtitle",
-                "Choose a game to launch in its own window. Add new games to the project and they will appear here.",
-            ),
-            style="HeroMuted.TLabel",
-            wraplength=520,
-            justify="left",
-        )
+        self.title_label = ttk.Label(container, style="HeroTitle.TLabel")
+        self.subtitle_label = ttk.Label(container, style="HeroMuted.TLabel", wraplength=520, justify="left")
 
-        title.pack(anchor="w")
+        self.title_label.pack(anchor="w")
         self.subtitle_label.pack(anchor="w", pady=(4, 8))
 
-        ready = sum(1 for g in self.games if g.available)
-        total = len(self.games)
-        badge_style = "Badge.TLabel" if ready else "BadgeMuted.TLabel"
-        badge_text = self._t("launcher.badge", "{ready}/{total} ready to launch", ready=ready, total=total)
-        ttk.Label(container, text=badge_text, style=badge_style).pack(anchor="w")
+        self.badge_label = ttk.Label(container)
+        self.badge_label.pack(anchor="w")
 
         lang_row = ttk.Frame(container, style="Hero.TFrame")
         lang_row.pack(anchor="w", pady=(10, 0))
-        ttk.Label(lang_row, text=self._t("launcher.language", "Language") + ":", style="HeroTitle.TLabel").pack(
-            side="left", padx=(0, 8)
-        )
+        self.language_label = ttk.Label(lang_row, style="HeroTitle.TLabel")
+        self.language_label.pack(side="left", padx=(0, 8))
         lang_box = ttk.Combobox(
             lang_row,
             textvariable=self.language_var,
@@ -162,21 +221,20 @@ class GameLauncherApp:
         lang_box.pack(side="left", padx=(0, 12))
         lang_box.bind("<<ComboboxSelected>>", lambda e: self._on_language_change(lang_box.get()))
 
-        ttk.Label(lang_row, text=self._t("launcher.theme", "Theme") + ":", style="HeroTitle.TLabel").pack(side="left", padx=(0, 8))
+        self.theme_label = ttk.Label(lang_row, style="HeroTitle.TLabel")
+        self.theme_label.pack(side="left", padx=(0, 8))
         theme_box = ttk.Combobox(
             lang_row,
             textvariable=self.theme_var,
-            values=list(PALETTES.keys()),
+            values=list(self._palettes.keys()),
             state="readonly",
             width=16,
         )
         theme_box.pack(side="left")
         theme_box.bind("<<ComboboxSelected>>", lambda e: self._on_theme_change())
 
-        sound_chk = ttk.Checkbutton(
-            lang_row, text=self._t("launcher.sound", "Sound"), variable=self.sound_enabled, command=self._save_settings
-        )
-        sound_chk.pack(side="left", padx=(12, 0))
+        self.sound_check = ttk.Checkbutton(lang_row, variable=self.sound_enabled, command=self._save_settings)
+        self.sound_check.pack(side="left", padx=(12, 0))
 
         return container
 
@@ -186,6 +244,7 @@ class GameLauncherApp:
         list_container.rowconfigure(0, weight=1)
 
         canvas = tk.Canvas(list_container, highlightthickness=0, bg=self._color("BG"))
+        self.list_canvas = canvas
         vbar = ttk.Scrollbar(list_container, orient="vertical", command=canvas.yview)
         canvas.configure(yscrollcommand=vbar.set)
         canvas.grid(row=0, column=0, sticky="nsew")
@@ -206,12 +265,18 @@ class GameLauncherApp:
         for game in self.games:
             self._render_game_card(inner, game)
 
-        # Basic mouse wheel support
+        # Basic mouse wheel support, scoped to the game list via a shared bind tag
+        # instead of a bind_all handler that sees every wheel event in the app.
         def _on_mousewheel(event: tk.Event) -> None:
             if event.delta:
                 canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel, add="+")
+        self.root.bind_class("LauncherWheel", "<MouseWheel>", _on_mousewheel)
+        pending: list[tk.Misc] = [canvas]
+        while pending:
+            widget = pending.pop()
+            widget.bindtags(("LauncherWheel",) + widget.bindtags())
+            pending.extend(widget.winfo_children())
 
         return list_container
 
@@ -225,32 +290,15 @@ class GameLauncherApp:
         inner = ttk.Frame(card, style="CardInner.TFrame", padding=14)
         inner.grid(row=0, column=1, sticky="nsew")
 
-        heading_text = self._t(game.name_key, game.name) if game.name_key else game.name
-        heading = ttk.Label(inner, text=heading_text, style="CardHeading.TLabel")
+        heading = ttk.Label(inner, style="CardHeading.TLabel")
         heading.grid(row=0, column=0, sticky="w")
 
-        lock_holder = getattr(self, "active_game_holder", None)
-        locked_by_other = lock_holder and lock_holder != game.name
-        locked_by_self = lock_holder and lock_holder == game.name
-        status_style = "Status.TLabel" if game.available and not (locked_by_other or locked_by_self) else "DisabledStatus.TLabel"
-        if not game.available:
-            status_text = self._t("launcher.status.missing", "Missing files")
-        elif locked_by_other:
-            status_text = f"In use by {lock_holder}"
-        elif locked_by_self:
-            status_text = "Already running"
-        else:
-            status_text = self._t("launcher.status.ready", "Ready to play")
-        status = ttk.Label(inner, text=status_text, style=status_style)
+        status = ttk.Label(inner)
         status.grid(row=0, column=1, sticky="e", padx=(10, 0))
 
-        desc_text = self._t(game.desc_key, game.description) if game.desc_key else game.description
-        desc = ttk.Label(inner, text=desc_text, style="CardText.TLabel", justify="left")
+        desc = ttk.Label(inner, style="CardText.TLabel", justify="left")
         desc.grid(row=1, column=0, columnspan=2, sticky="w", pady=(6, 6))
-        desc.bind(
-            "<Configure>",
-            lambda e, lbl=desc: lbl.configure(wraplength=max(240, e.width - 20)),
-        )
+        # Wrap width follows the window via the debounced _on_resize pass.
         self._desc_labels.append(desc)
 
         meta = ttk.Frame(inner, style="CardInner.TFrame")
@@ -259,10 +307,8 @@ class GameLauncherApp:
 
         launch_btn = ttk.Button(
             inner,
-            text=self._t("launcher.launch", "Launch"),
             style="Launch.TButton",
             command=lambda g=game: self._launch_game(g),
-            state=("normal" if game.available and not (locked_by_other or locked_by_self) else "disabled"),
             width=14,
         )
         launch_btn.grid(row=0, column=2, rowspan=3, padx=(16, 0))
@@ -272,12 +318,44 @@ class GameLauncherApp:
         inner.columnconfigure(2, weight=0)
         card.columnconfigure(0, weight=0)
         card.columnconfigure(1, weight=1)
+        self._card_widgets.append((game, {"stripe": stripe, "heading": heading, "status": status, "desc": desc, "launch": launch_btn}))
+
+    def _refresh_game_card(self, game: GameEntry, widgets: dict) -> None:
+        widgets["stripe"].configure(bg=self._color("ACCENT"))
+        heading_text = self._t(game.name_key, game.name) if game.name_key else game.name
+        widgets["heading"].configure(text=heading_text)
+
+        lock_holder = getattr(self, "active_game_holder", None)
+        locked_by_other = lock_holder and lock_holder != game.name
+        locked_by_self = lock_holder and lock_holder == game.name
+        status_style = "Status.TLabel" if game.available and not (locked_by_other or locked_by_self) else "DisabledStatus.TLabel"
+        if not game.available:
+            status_text = self._t("launcher.status.missing", "Missing files")
+        elif locked_by_other:
+            status_text = f"In use by {lock_holder}"
+        elif locked_by_self:
+            status_text = "Already running"
+        else:
+            status_text = self._t("launcher.status.ready", "Ready to play")
+        widgets["status"].configure(text=status_text, style=status_style)
+
+        desc_text = self._t(game.desc_key, game.description) if game.desc_key else game.description
+        widgets["desc"].configure(text=desc_text)
+        widgets["launch"].configure(
+            text=self._t("launcher.launch", "Launch"),
+            state=("normal" if game.available and not (locked_by_other or locked_by_self) else "disabled"),
+        )
 
     def _discover_languages(self) -> list[str]:
-        locales_dir = Path(__file__).resolve().parent / "shared" / "locales"
-        codes = [p.stem for p in locales_dir.glob("*.json")]
-        codes = sorted(set(codes))
-        return codes or ["en"]
+        global _LANG_CODES_CACHE
+        if _LANG_CODES_CACHE is None:
+            try:
+                with os.scandir(LOCALES_DIR) as it:
+                    codes = sorted({e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()})
+            except OSError:
+                codes = []
+            _LANG_CODES_CACHE = codes or ["en"]
+        return list(_LANG_CODES_CACHE)
 
     def _display_path(self, path: Path) -> str:
         try:
@@ -289,46 +367,52 @@ class GameLauncherApp:
         return self.language_names.get(code, code)
 
     def _on_language_change(self, display_value: str) -> None:
-        code = next((c for c, lbl in self.language_names.items() if lbl == display_value), display_value)
+        code = self._display_to_code.get(display_value, display_value)
         self.language = code if code in self.available_languages else "en"
         self.language_var.set(self._lang_display(self.language))
         self._load_translations(self.language)
-        self._render_ui()
+        self._refresh_ui()
         self._save_settings()
 
     def _on_theme_change(self) -> None:
-        self._render_ui()
+        self._refresh_ui()
         self._save_settings()
 
     def _load_translations(self, lang: str) -> None:
         """Load translations for the launcher UI."""
         self.translations = {}
         fallback_file = LOCALES_DIR / "en.json"
-        lang_file = LOCALES_DIR / f"{lang}.json"
-        for path in (fallback_file, lang_file):
-            if not path.exists():
-                continue
-            try:
-                data = json.loads(path.read_text(encoding="utf-8"))
+        paths = (fallback_file,) if lang == "en" else (fallback_file, LOCALES_DIR / f"{lang}.json")
+        for path in paths:
+            data = _read_locale(path)
+            if isinstance(data, dict):
                 self.translations.update(data)
-            except Exception:
-                continue
 
     def _t(self, key: str, default: str, **kwargs) -> str:
         text = self.translations.get(key, default)
+        if not kwargs:
+            # Plain labels carry no placeholders; skip str.format entirely.
+            return text
+        cache_key = (text, tuple(sorted(kwargs.items())))
+        try:
+            return _FORMAT_CACHE[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            cache_key = None  # unhashable argument; format without caching
         try:
-            return text.format(**kwargs)
+            result = text.format(**kwargs)
         except Exception:
-            return text
+            result = text
+        if cache_key is not None:
+            _FORMAT_CACHE[cache_key] = result
+        return result
 
-    def _render_ui(self) -> None:
-        for child in self.root.winfo_children():
-            child.destroy()
-        self.root.title(self._t("launcher.window_title", "Game Launcher"))
-        self.active_game_holder = self._active_lock_holder()
-        self.palette = self._palette()
+    def _build_ui_once(self) -> None:
+        """Create the launcher widgets; later language/theme changes go through _refresh_ui."""
         self._apply_theme()
         self._desc_labels = []
+        self._card_widgets: list[tuple[GameEntry, dict]] = []
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=0)
         self.root.rowconfigure(1, weight=0)
@@ -338,6 +422,36 @@ class GameLauncherApp:
         ttk.Separator(self.root).grid(row=1, column=0, sticky="ew")
         games = self._build_game_list()
         games.grid(row=2, column=0, sticky="nsew")
+        self._refresh_ui()
+
+    def _refresh_ui(self) -> None:
+        """Re-apply theme and translated text to the existing widgets."""
+        self.root.title(self._t("launcher.window_title", "Game Launcher"))
+        self.active_game_holder = self._active_lock_holder()
+        self._apply_theme()
+        self.title_label.configure(text=self._t("launcher.title", "Arcade Hub"))
+        self.subtitle_label.configure(
+            text=self._t(
+                "launcher.subtitle",
+                "Choose a game to launch in its own window. Add new games to the project and they will appear here.",
+            )
+        )
+        for g in self.games:
+            if not g.available:
+                # Only missing games are re-checked, in case their files were added since startup.
+                g.available = g.script_path.is_file()
+        ready = sum(1 for g in self.games if g.available)
+        total = len(self.games)
+        self.badge_label.configure(
+            text=self._t("launcher.badge", "{ready}/{total} ready to launch", ready=ready, total=total),
+            style="Badge.TLabel" if ready else "BadgeMuted.TLabel",
+        )
+        self.language_label.configure(text=self._t("launcher.language", "Language") + ":")
+        self.theme_label.configure(text=self._t("launcher.theme", "Theme") + ":")
+        self.sound_check.configure(text=self._t("launcher.sound", "Sound"))
+        self.list_canvas.configure(bg=self._color("BG"))
+        for game, widgets in self._card_widgets:
+            self._refresh_game_card(game, widgets)
 
     def _save_settings(self) -> None:
         payload = {"language": self.language, "theme": self.theme_var.get(), "sound": self.sound_enabled.get()}
@@ -349,7 +463,17 @@ class GameLauncherApp:
 
         The launcher itself never locks this; games own it. If we can acquire
         it non-blocking, it is free; release immediately and report None.
+        Results are reused for LOCK_PROBE_TTL seconds so rapid re-renders
+        don't hammer the lock file.
         """
+        now = time.monotonic()
+        if self._lock_cache is not None and now - self._lock_cache[0] < LOCK_PROBE_TTL:
+            return self._lock_cache[1]
+        holder = self._probe_lock_holder()
+        self._lock_cache = (now, holder)
+        return holder
+
+    def _probe_lock_holder(self) -> Optional[str]:
         try:
             if single_instance.try_acquire_lock(ACTIVE_GAME_LOCK, "launcher-probe"):
                 try:
@@ -362,13 +486,21 @@ class GameLauncherApp:
             return single_instance.lock_holder(ACTIVE_GAME_LOCK)
 
     def _on_resize(self, event: tk.Event) -> None:
+        # <Configure> fires for every widget during a drag; coalesce into one wrap pass.
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(50, self._apply_wraplengths)
+
+    def _apply_wraplengths(self) -> None:
+        self._resize_after = None
         if getattr(self, "subtitle_label", None):
-            wrap = max(320, event.width - 180)
+            wrap = max(320, self.root.winfo_width() - 180)
             self.subtitle_label.configure(wraplength=wrap)
         for lbl in getattr(self, "_desc_labels", []):
             lbl.configure(wraplength=max(240, lbl.winfo_width() - 20))
 
     def _launch_game(self, game: GameEntry) -> None:
+        self._lock_cache = None
         # Prevent launching if another game holds the shared lock.
         if getattr(self, "active_game_holder", None):
             holder = self.active_game_holder
@@ -406,8 +538,7 @@ class GameLauncherApp:
             return
 
         try:
-            env = os.environ.copy()
-            env["GAME_LANGUAGE"] = self.language or "en"
+            env = {**self._base_env, "GAME_LANGUAGE": self.language or "en"}
             if not self.sound_enabled.get():
                 env["GAME_SOUND"] = "0"
             subprocess.Popen(game.command, cwd=game.script_path.parent, env=env)
@@ -426,6 +557,8 @@ class GameLauncherApp:
     def _play_click(self) -> None:
         if not self.sound_enabled.get():
             return
+        if self.click_player is None:
+            self.click_player = audio.ClickPlayer()
         self.click_player.play_click()
 
     def _load_games(self) -> list[GameEntry]:
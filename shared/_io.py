@@ -0,0 +1,40 @@
+"""Small file-writing helpers shared by the JSON-backed modules."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+# Last payload written per resolved path, tagged with the file's (mtime_ns, size) right after the write.
+_LAST_WRITTEN: Dict[str, Tuple[int, int, str]] = {}
+
+
+def write_if_changed(path: Path, payload: str) -> None:
+    """Atomically write ``payload`` unless this process already wrote exactly it and the file is untouched since."""
+    key = os.fspath(path.resolve())
+    cached = _LAST_WRITTEN.get(key)
+    if cached is not None and cached[2] == payload:
+        try:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) == cached[:2]:
+                return
+        except OSError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write a sibling temp file and swap it in, so a crash mid-write never truncates the target.
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    st = path.stat()
+    _LAST_WRITTEN[key] = (st.st_mtime_ns, st.st_size, payload)
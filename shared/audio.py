@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import array
 import os
+import sys
 import wave
-import struct
 import math
 import tempfile
 from pathlib import Path
@@ -16,18 +17,29 @@ except Exception:  # pragma: no cover
     winsound = None  # type: ignore[assignment]
 
 
+_FRAMERATE = 44100
+_WAV_HEADER_BYTES = 44  # canonical RIFF/fmt/data header written by ``wave`` for PCM
+
+
+def _click_file_size(duration_ms: int = 60) -> int:
+    """Byte size of a complete mono 16-bit click written by :func:`_generate_click`."""
+    return _WAV_HEADER_BYTES + 2 * int(_FRAMERATE * duration_ms / 1000)
+
+
 def _generate_click(path: Path, duration_ms: int = 60, freq: int = 1000) -> None:
     """Generate a simple sine wave wav file."""
-    framerate = 44100
+    framerate = _FRAMERATE
     amp = 32767
     samples = int(framerate * duration_ms / 1000)
+    step = 2 * math.pi * freq / framerate
+    pcm = array.array("h", [int(amp * math.sin(step * i)) for i in range(samples)])
+    if sys.byteorder == "big":
+        pcm.byteswap()  # WAV samples are little-endian
     with wave.open(str(path), "w") as wav:
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(framerate)
-        for i in range(samples):
-            val = int(amp * math.sin(2 * math.pi * freq * (i / framerate)))
-            wav.writeframes(struct.pack("<h", val))
+        wav.writeframes(pcm)  # buffer protocol: no intermediate bytes copy
 
 
 class ClickPlayer:
@@ -41,6 +53,10 @@ class ClickPlayer:
             return self._click_path
         tmp = Path(tempfile.gettempdir()) / "launcher_click.wav"
         try:
+            # A complete click from an earlier run (or another game) is reused as-is.
+            if tmp.is_file() and tmp.stat().st_size == _click_file_size():
+                self._click_path = tmp
+                return tmp
             _generate_click(tmp)
             self._click_path = tmp
             return tmp
@@ -8,8 +8,10 @@ the deck helpers without pulling in GUI or Tic-Tac-Toe specific code.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
+import itertools
 import random
-from typing import Iterable, Iterator, List, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 SUITS = ("Spades", "Hearts", "Clubs", "Diamonds")
@@ -18,7 +20,7 @@ JOKER = "Joker"
 VERSION = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     """Represents a single playing card."""
 
@@ -53,7 +55,7 @@ class Card:
 
         normalized = label.strip()
         if normalized.lower() == JOKER.lower():
-            return cls(JOKER, JOKER)
+            return _make_card(JOKER, JOKER) if cls is Card else cls(JOKER, JOKER)
 
         if " of " in normalized:
             rank, suit = normalized.split(" of ", maxsplit=1)
@@ -63,12 +65,36 @@ class Card:
             suit = suit_lookup.get(suit_code)
             if suit is None:
                 raise ValueError(f"Unknown suit code '{suit_code}' in '{label}'")
-        return cls(rank.strip(), suit.strip())
+        rank, suit = rank.strip(), suit.strip()
+        return _make_card(rank, suit) if cls is Card else cls(rank, suit)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_card(rank: str, suit: str) -> Card:
+    """Return the canonical :class:`Card` for ``rank``/``suit``; equal cards are the same object."""
+
+    return Card(rank, suit)
+
+
+# Cards are immutable, so every deck shares these instances instead of building its own.
+_STANDARD_DECK: Tuple[Card, ...] = tuple(_make_card(rank, suit) for suit, rank in itertools.product(SUITS, RANKS))
+_JOKERS: Tuple[Card, ...] = (_make_card(JOKER, JOKER),) * 2
+
+
+@functools.lru_cache(maxsize=None)
+def _shoe(include_jokers: bool, num_decks: int) -> Tuple[Card, ...]:
+    """Bottom-to-top card order for a fresh shoe; shared by every deck with the same layout."""
+
+    base = _STANDARD_DECK + _JOKERS if include_jokers else _STANDARD_DECK
+    # Every copy is identical, so reversing one deck before repeating it equals reversing the shoe.
+    return base[::-1] * num_decks
 
 
 class Deck:
     """A standard deck that supports shuffling, drawing, and dealing cards."""
 
+    __slots__ = ("include_jokers", "num_decks", "_rng", "_original_cards", "_cards", "_discards")
+
     def __init__(
         self,
         *,
@@ -81,19 +107,18 @@ class Deck:
 
         self.include_jokers = include_jokers
         self.num_decks = num_decks
-        self._rng = random.Random(seed)
+        # Unseeded decks share the module-level generator instead of seeding a private one
+        # from os.urandom on every construction; only seeded decks need isolated state.
+        self._rng = random.Random(seed) if seed is not None else random
         self._original_cards = self._build_cards()
+        # Stored bottom-to-top: the top card is ``_cards[-1]`` so draws pop from the tail
+        # instead of shifting every remaining card left.
         self._cards: List[Card] = list(self._original_cards)
-        self._discards: List[Card] = []
+        # Created on the first discard; many games never use the discard pile.
+        self._discards: Optional[List[Card]] = None
 
-    def _build_cards(self) -> List[Card]:
-        cards: List[Card] = []
-        for _ in range(self.num_decks):
-            cards.extend(Card(rank, suit) for suit in SUITS for rank in RANKS)
-            if self.include_jokers:
-                cards.append(Card(JOKER, JOKER))
-                cards.append(Card(JOKER, JOKER))
-        return cards
+    def _build_cards(self) -> Tuple[Card, ...]:
+        return _shoe(self.include_jokers, self.num_decks)
 
     def shuffle(self) -> None:
         """Shuffle the deck in place."""
@@ -107,8 +132,9 @@ class Deck:
             shuffle: When True, the deck is shuffled after being reset.
         """
 
-        self._cards = list(self._original_cards)
-        self._discards.clear()
+        # Refill the existing list in place rather than allocating a fresh one per reset.
+        self._cards[:] = self._original_cards
+        self._discards = None
         if shuffle:
             self.shuffle()
 
@@ -126,14 +152,17 @@ class Deck:
             return []
         if count > len(self._cards):
             raise IndexError("not enough cards remaining in deck")
-        drawn = self._cards[:count]
-        del self._cards[:count]
+        drawn = self._cards[-count:]
+        del self._cards[-count:]
+        drawn.reverse()
         return drawn
 
     def draw_one(self) -> Card:
         """Draw a single card for convenience."""
 
-        return self.draw(1)[0]
+        if not self._cards:
+            raise IndexError("not enough cards remaining in deck")
+        return self._cards.pop()
 
     def deal_hands(self, num_hands: int, cards_per_hand: int) -> List[List[Card]]:
         """Deal ``num_hands`` each with ``cards_per_hand`` cards.
@@ -154,16 +183,19 @@ class Deck:
     def discard(self, cards: Sequence[Card] | Card) -> None:
         """Place cards into a discard pile for optional reuse later."""
 
+        if self._discards is None:
+            self._discards = []
         if isinstance(cards, Card):
             self._discards.append(cards)
         else:
             self._discards.extend(cards)
 
     def recycle_discards(self, *, shuffle: bool = True) -> None:
-        """Return discarded cards to the deck."""
+        """Return discarded cards to the bottom of the deck."""
 
-        self._cards.extend(self._discards)
-        self._discards.clear()
+        if self._discards:
+            self._cards[:0] = reversed(self._discards)
+            self._discards.clear()
         if shuffle:
             self.shuffle()
 
@@ -175,11 +207,12 @@ class Deck:
     def discard_count(self) -> int:
         """Return the number of cards in the discard pile."""
 
-        return len(self._discards)
+        return 0 if self._discards is None else len(self._discards)
 
     def __len__(self) -> int:  # pragma: no cover - convenience alias
         return self.remaining()
 
     def __iter__(self) -> Iterator[Card]:  # pragma: no cover - convenience alias
-        return iter(self._cards)
+        """Iterate from the top of the deck, i.e. in draw order."""
+        return reversed(self._cards)
 
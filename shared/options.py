@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Iterable, Sequence
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Sequence
 
 
-Toggle = tuple[str, tk.Variable, Callable[[], None]]
-Action = tuple[str, Callable[[], None]]
+# Variables and callbacks may be given directly or as names of ``gui`` attributes,
+# so games can keep their option rows as static module-level tables.
+Toggle = tuple[str, "tk.Variable | str", "Callable[[], None] | str"]
+Action = tuple[str, "Callable[[], None] | str"]
 THEME_CHOICES = (
     "default",
     "high_contrast",
@@ -19,7 +22,7 @@ THEME_CHOICES = (
     "light",
     "dark",
 )
-PALETTES = {
+_PALETTE_DATA = {
     "default": {
         # Vivid but comfortable midnight palette for legibility
         "BG": "#0c1222",
@@ -118,6 +121,10 @@ PALETTES = {
         "BORDER": "#22304a",
     },
 }
+# Read-only views so no game can mutate the shared palettes another game (or theme) relies on.
+PALETTES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {name: MappingProxyType(colors) for name, colors in _PALETTE_DATA.items()}
+)
 
 
 def show_options_popup(
@@ -136,16 +143,31 @@ def show_options_popup(
       - theme_var, _on_theme_change
       - language, available_languages, _lang_display, _on_language_change
       - _update_theme_swatch(canvas), _copy_diagnostics
+
+    String entries in ``toggles``/``preset_actions`` are looked up on ``gui`` each time the popup opens.
     """
-    if getattr(gui, "options_popup", None) and gui.options_popup.winfo_exists():
-        gui.options_popup.lift()
-        gui.options_popup.focus_set()
-        return
+    existing = getattr(gui, "options_popup", None)
+    if existing is not None and not existing.winfo_exists():
+        gui.options_popup = existing = None
+    if existing is not None:
+        # Closing only withdraws the popup, so reopening reuses the widget tree when its shape still fits.
+        if existing.sync_state(toggles, preset_actions, title, subtitle):
+            existing.deiconify()
+            existing.lift()
+            existing.focus_set()
+            return
+        existing.destroy()
+        gui.options_popup = None
 
     popup = tk.Toplevel(gui.root)
+    # Stay hidden while the widget tree is built so it is laid out and drawn once, not row by row.
+    popup.withdraw()
     popup.title(title)
-    popup.configure(bg=gui._color("BG"))
+    # Resolve the palette once for this build; _color may go through Tk variables on some games.
+    bg, panel, border = (gui._color(key) for key in ("BG", "PANEL", "BORDER"))
+    popup.configure(bg=bg)
     popup.minsize(380, 500)
+    popup.protocol("WM_DELETE_WINDOW", lambda: _close_options_popup(gui, popup))
     gui.options_popup = popup
 
     frame = ttk.Frame(popup, padding=20, style="Panel.TFrame")
@@ -154,26 +176,30 @@ def show_options_popup(
     popup.rowconfigure(0, weight=1)
     frame.columnconfigure((0, 1), weight=1)
 
-    ttk.Label(frame, text=title, style="Banner.TLabel").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 6))
-    ttk.Label(frame, text=subtitle, style="Muted.TLabel").grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 12))
+    title_label = ttk.Label(frame, text=title, style="Banner.TLabel")
+    title_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 6))
+    subtitle_label = ttk.Label(frame, text=subtitle, style="Muted.TLabel")
+    subtitle_label.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 12))
 
     row = 2
     toggle_frame = ttk.Frame(frame, style="Panel.TFrame", padding=(10, 8))
     toggle_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 6))
-    toggle_frame.columnconfigure(0, weight=1)
     row += 1
-    toggle_row = 0
+    # A single left-aligned column needs no grid bookkeeping; pack stacks the rows in order.
+    toggle_buttons: list[ttk.Checkbutton] = []
     for text, var, cmd in toggles:
-        ttk.Checkbutton(toggle_frame, text=text, variable=var, style="App.TCheckbutton", command=cmd).grid(
-            row=toggle_row, column=0, columnspan=2, sticky="w", pady=2, padx=(0, 6)
+        check = ttk.Checkbutton(
+            toggle_frame, text=text, variable=_resolve(gui, var), style="App.TCheckbutton", command=_resolve(gui, cmd)
         )
-        toggle_row += 1
+        check.pack(anchor="w", pady=2, padx=(0, 6))
+        toggle_buttons.append(check)
     row = 3
 
+    preset_buttons: list[ttk.Button] = []
     for idx, (label, action) in enumerate(preset_actions):
-        ttk.Button(frame, text=label, style="Panel.TButton", command=action).grid(
-            row=row, column=idx % 2, sticky="ew", pady=(10, 4), padx=(0, 0)
-        )
+        button = ttk.Button(frame, text=label, style="Panel.TButton", command=_resolve(gui, action))
+        button.grid(row=row, column=idx % 2, sticky="ew", pady=(10, 4), padx=(0, 0))
+        preset_buttons.append(button)
         if idx % 2 == 1:
             row += 1
     if preset_actions and len(preset_actions) % 2 != 0:
@@ -188,12 +214,23 @@ def show_options_popup(
         frame,
         textvariable=gui.theme_var,
         state="readonly",
-        values=list(theme_choices),
+        values=theme_choices,
         style="App.TCombobox",
         width=20,
     )
     theme_box.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 4))
-    theme_box.bind("<<ComboboxSelected>>", gui._on_theme_change)
+    applied_theme = gui.theme_var.get()
+
+    def on_theme_selected(event=None) -> None:
+        nonlocal applied_theme
+        # theme_var is already updated by the combobox; re-picking the current theme is a no-op.
+        theme = gui.theme_var.get()
+        if theme == applied_theme:
+            return
+        applied_theme = theme
+        gui._on_theme_change(event)
+
+    theme_box.bind("<<ComboboxSelected>>", on_theme_selected)
     row += 1
 
     ttk.Label(frame, text=getattr(gui, "_t", lambda k, v: "Language")("options.language", "Language"), style="Title.TLabel").grid(
@@ -201,28 +238,62 @@ def show_options_popup(
     )
     row += 1
     lang_var = tk.StringVar(value=gui._lang_display(gui.language))
+    lang_displays = [gui._lang_display(code) for code in gui.available_languages]
+    code_for_display = dict(zip(lang_displays, gui.available_languages))
     lang_box = ttk.Combobox(
         frame,
         textvariable=lang_var,
-        values=[gui._lang_display(code) for code in gui.available_languages],
+        values=lang_displays,
         state="readonly",
         style="App.TCombobox",
         width=20,
     )
     lang_box.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 8))
-    lang_box.bind(
-        "<<ComboboxSelected>>",
-        lambda e: gui._on_language_change(
-            next((code for code in gui.available_languages if gui._lang_display(code) == lang_var.get()), gui.language)
-        ),
-    )
+
+    def on_language_selected(_event=None) -> None:
+        code = code_for_display.get(lang_var.get(), gui.language)
+        # <<ComboboxSelected>> also fires when the current entry is re-picked; reloading
+        # translations for the language already in use would be wasted work.
+        if code != gui.language:
+            gui._on_language_change(code)
+
+    lang_box.bind("<<ComboboxSelected>>", on_language_selected)
     row += 1
 
-    swatch = tk.Canvas(frame, height=28, bg=gui._color("PANEL"), highlightthickness=1, highlightbackground=gui._color("BORDER"))
+    swatch = tk.Canvas(frame, height=28, bg=panel, highlightthickness=1, highlightbackground=border)
     swatch.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 10))
     gui._update_theme_swatch(swatch)
     row += 1
 
+    def restyle() -> None:
+        # The tk (non-ttk) parts don't follow ttk styles, so repaint them from the current palette.
+        popup.configure(bg=gui._color("BG"))
+        swatch.configure(bg=gui._color("PANEL"), highlightbackground=gui._color("BORDER"))
+        gui._update_theme_swatch(swatch)
+
+    def sync_state(new_toggles: Sequence[Toggle], new_presets: Sequence[Action], new_title: str, new_subtitle: str) -> bool:
+        """Rebind a reshown popup to this call's arguments; False when the rows no longer match."""
+        nonlocal applied_theme
+        if len(new_toggles) != len(toggle_buttons) or len(new_presets) != len(preset_buttons):
+            return False
+        for check, (text, var, cmd) in zip(toggle_buttons, new_toggles):
+            check.configure(text=text, variable=_resolve(gui, var), command=_resolve(gui, cmd))
+        for button, (label, action) in zip(preset_buttons, new_presets):
+            button.configure(text=label, command=_resolve(gui, action))
+        popup.title(new_title)
+        title_label.configure(text=new_title)
+        subtitle_label.configure(text=new_subtitle)
+        # Theme or language may have changed elsewhere while the popup was hidden.
+        applied_theme = gui.theme_var.get()
+        lang_var.set(gui._lang_display(gui.language))
+        restyle()
+        return True
+
+    popup.sync_state = sync_state
+    popup.restyle = restyle
+    # Kept on the popup so games can repaint the swatch without walking the widget tree.
+    popup.swatch = swatch
+
     ttk.Button(frame, text="Copy diagnostics", style="Accent.TButton", command=gui._copy_diagnostics).grid(
         row=row, column=0, columnspan=1, sticky="ew", pady=(8, 0)
     )
@@ -230,9 +301,22 @@ def show_options_popup(
         row=row, column=1, columnspan=1, sticky="ew", pady=(8, 0)
     )
 
+    popup.update_idletasks()
+    popup.deiconify()
+    popup.lift()
+    popup.focus_set()
+
+
+def _resolve(gui, value):
+    return getattr(gui, value) if isinstance(value, str) else value
+
 
 def _close_options_popup(gui, popup: tk.Toplevel) -> None:
     try:
-        popup.destroy()
-    finally:
+        if popup.winfo_exists():
+            popup.withdraw()
+            return
+    except tk.TclError:
+        pass
+    if gui.options_popup is popup:
         gui.options_popup = None
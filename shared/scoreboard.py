@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
+import heapq
 import json
-from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List
+from typing import List, NamedTuple
 
+from shared._io import write_if_changed
 
-@dataclass
-class ScoreEntry:
+
+class ScoreEntry(NamedTuple):
     name: str
     score: int
 
 
 def load_scores(path: Path) -> List[ScoreEntry]:
-    if not path.exists():
-        return []
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        return [ScoreEntry(**item) for item in raw if "name" in item and "score" in item]
+        # A missing file lands in the except below, like any other unreadable board.
+        raw = json.loads(path.read_bytes())
+        entry = ScoreEntry
+        return [
+            entry(name, score)
+            for item in raw
+            if (name := item.get("name")) is not None
+            # Hand-edited boards may hold "12" or true; mixing those with ints breaks the ranking.
+            and isinstance(score := item.get("score"), int)
+            and not isinstance(score, bool)
+        ]
     except Exception:
         return []
 
@@ -27,7 +35,8 @@ def load_scores(path: Path) -> List[ScoreEntry]:
 def add_score(path: Path, name: str, score: int, limit: int = 10) -> List[ScoreEntry]:
     scores = load_scores(path)
     scores.append(ScoreEntry(name=name, score=score))
-    scores = sorted(scores, key=lambda s: s.score, reverse=True)[:limit]
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps([asdict(s) for s in scores], indent=2), encoding="utf-8")
+    # Same result as sorting descending and slicing, without sorting the entries that get dropped.
+    scores = heapq.nlargest(limit, scores, key=lambda s: s.score)
+    # A score that doesn't make the board leaves the file as it was.
+    write_if_changed(path, json.dumps([s._asdict() for s in scores], indent=2))
     return scores
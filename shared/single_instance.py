@@ -10,34 +10,41 @@ from __future__ import annotations
 import atexit
 import os
 from pathlib import Path
-from typing import Dict, Optional, TextIO
+from typing import Dict, Optional
 
 if os.name == "nt":  # pragma: win32-no-cover
     import msvcrt
 else:  # pragma: linux/mac-no-cover
     import fcntl
 
-# Keep lock handles alive for the lifetime of the process.
-_LOCK_HANDLES: Dict[Path, TextIO] = {}
+# Keep lock handles alive for the lifetime of the process, keyed by the normalized lock path
+# (see _lock_key) so every spelling of the same file shares one entry.
+_LOCK_HANDLES: Dict[str, int] = {}
 
 
-def _unlock(path: Path) -> None:
-    handle = _LOCK_HANDLES.pop(path, None)
-    if not handle:
+def _lock_key(lock_path) -> str:
+    return os.path.normcase(os.path.abspath(lock_path))
+
+
+def _unlock(key: str) -> None:
+    fd = _LOCK_HANDLES.pop(key, None)
+    if fd is None:
         return
     try:
         if os.name == "nt":  # pragma: win32-no-cover
-            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            # msvcrt locks are byte ranges from the current offset; the label write moved it.
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
         else:  # pragma: linux/mac-no-cover
-            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            fcntl.flock(fd, fcntl.LOCK_UN)
     finally:
-        handle.close()
+        os.close(fd)
 
 
 def release_lock(lock_path: Path) -> None:
     """Release a previously acquired lock, if held by this process."""
     try:
-        _unlock(Path(lock_path))
+        _unlock(_lock_key(lock_path))
     except PermissionError:
         # If we somehow don't own the handle anymore, ignore.
         pass
@@ -53,31 +60,30 @@ def try_acquire_lock(lock_path: Path, label: Optional[str] = None) -> bool:
     ``label`` lets callers record a human-readable owner string in the
     lock file (e.g., the game name) for friendlier error messages.
     """
-    if lock_path in _LOCK_HANDLES:
+    key = _lock_key(lock_path)
+    if key in _LOCK_HANDLES:
         return True
 
-    lock_path = Path(lock_path)
+    lock_path = Path(key)
     lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-    handle: Optional[TextIO] = None
+    # A raw descriptor is all flock/msvcrt need; no buffered text wrapper for a one-line write.
+    fd: Optional[int] = None
     try:
-        handle = lock_path.open("a+")
-        handle.seek(0)
+        fd = os.open(key, os.O_CREAT | os.O_RDWR | getattr(os, "O_BINARY", 0), 0o644)
         if os.name == "nt":  # pragma: win32-no-cover
-            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
         else:  # pragma: linux/mac-no-cover
-            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-        handle.seek(0)
-        handle.truncate()
-        handle.write(label or str(os.getpid()))
-        handle.flush()
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.ftruncate(fd, 0)
+        os.write(fd, (label or str(os.getpid())).encode("utf-8"))
     except OSError:
-        if handle:
-            handle.close()
+        if fd is not None:
+            os.close(fd)
         return False
 
-    _LOCK_HANDLES[lock_path] = handle
-    atexit.register(_unlock, lock_path)
+    _LOCK_HANDLES[key] = fd
+    atexit.register(_unlock, key)
     return True
 
 
@@ -32,25 +32,10 @@ class TestCliJson(unittest.TestCase):
                 ]
             )
         output = buf.getvalue()
-        # capture JSON object in output
-        lines = output.splitlines()
-        collect = []
-        depth = 0
-        started = False
-        for line in lines:
-            if not started and "{" in line:
-                frag = line[line.index("{") :]
-                collect.append(frag)
-                depth += frag.count("{") - frag.count("}")
-                started = True
-            elif started:
-                collect.append(line)
-                depth += line.count("{") - line.count("}")
-                if depth <= 0:
-                    break
-        self.assertTrue(collect, "No JSON found in output")
-        payload = "\n".join(collect)
-        data = json.loads(payload)
+        # The JSON object may follow other log lines; decode from its first brace.
+        start = output.find("{")
+        self.assertNotEqual(start, -1, "No JSON found in output")
+        data, _end = json.JSONDecoder().raw_decode(output, start)
         self.assertEqual(data["ai_x"], "Hard")
         self.assertEqual(data["ai_o"], "Hard")
         self.assertIn("scores", data)
@@ -19,6 +19,31 @@ class TestCoreLogic(unittest.TestCase):
         self.assertEqual(game.check_winner(diag_win), "O")
         self.assertIsNone(game.check_winner(no_win))
 
+    def test_winner_from_bits_matches_check_winner(self) -> None:
+        boards = [
+            ["X", "X", "X", " ", " ", " ", " ", " ", " "],
+            ["O", "X", " ", "X", "O", " ", " ", " ", "O"],
+            ["X", "O", "X", "X", "O", "O", "O", "X", "X"],
+            [" "] * 9,
+        ]
+        for board in boards:
+            x_bits = sum(1 << i for i, v in enumerate(board) if v == "X")
+            o_bits = sum(1 << i for i, v in enumerate(board) if v == "O")
+            self.assertEqual(game.winner_from_bits(x_bits, o_bits), game.check_winner(board))
+            self.assertEqual((x_bits | o_bits) == game.FULL_MASK, game.board_full(board))
+            line = game.win_line_from_bits(x_bits, o_bits)
+            if line is None:
+                self.assertIsNone(game.check_winner(board))
+            else:
+                a, b, c = game.WIN_LINES[line]
+                self.assertEqual(board[a], game.check_winner(board))
+                self.assertTrue(board[a] == board[b] == board[c])
+
+    def test_check_terminal(self) -> None:
+        self.assertEqual(game.check_terminal(["X", "X", "X", "O", "O", " ", " ", " ", " "]), "X")
+        self.assertEqual(game.check_terminal(["X", "O", "X", "X", "O", "O", "O", "X", "X"]), "Draw")
+        self.assertIsNone(game.check_terminal(["X", "O", " ", " ", " ", " ", " ", " ", " "]))
+
     def test_ai_move_hard_wins_or_blocks(self) -> None:
         # Should take the winning move when available.
         winning_board = ["O", "O", " ", "X", "X", " ", " ", " ", " "]
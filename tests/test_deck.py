@@ -46,11 +46,24 @@ def test_draw_and_discard_cycle():
     assert deck.remaining() == 52
 
 
+def test_draw_order_matches_iteration():
+    deck = Deck()
+    expected = list(deck)
+    assert expected[0] == Card("A", "Spades")
+    assert deck.draw(2) == expected[:2]
+    assert deck.draw_one() == expected[2]
+    deck.discard(expected[:3])
+    deck.recycle_discards(shuffle=False)
+    assert list(deck) == expected[3:] + expected[:3]
+
+
 def test_card_helpers():
     card = Card("A", "Spades")
     assert card.label() == "A of Spades"
     assert card.short_name() == "AS"
     assert Card.from_label("A of Spades") == card
     assert Card.from_label("QD") == Card("Q", "Diamonds")
+    assert Card.from_label("QD") is Card.from_label("Q of Diamonds")
+    assert Card.from_label("AS") in list(Deck())
     assert SUITS == ("Spades", "Hearts", "Clubs", "Diamonds")
     assert RANKS[0] == "A"
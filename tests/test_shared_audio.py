@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(PROJECT_ROOT))
+
+from shared import audio
+
+
+class TestClickCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(audio.tempfile, "gettempdir", return_value=self.temp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.click = Path(self.temp_dir.name) / "launcher_click.wav"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_generated_click_matches_expected_size(self) -> None:
+        audio._generate_click(self.click)
+        self.assertEqual(self.click.stat().st_size, audio._click_file_size())
+
+    def test_complete_click_is_reused(self) -> None:
+        audio._generate_click(self.click)
+        with mock.patch.object(audio, "_generate_click") as generate:
+            self.assertEqual(audio.ClickPlayer()._ensure_click(), self.click)
+        generate.assert_not_called()
+
+    def test_truncated_click_is_regenerated(self) -> None:
+        self.click.write_bytes(b"RIFF")
+        self.assertEqual(audio.ClickPlayer()._ensure_click(), self.click)
+        self.assertEqual(self.click.stat().st_size, audio._click_file_size())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(PROJECT_ROOT))
+
+from shared._io import write_if_changed
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "data.json"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_identical_payload_skips_write(self) -> None:
+        write_if_changed(self.path, '{"a": 1}')
+        before = self.path.stat()
+        write_if_changed(self.path, '{"a": 1}')
+        after = self.path.stat()
+        # Every real write goes through os.replace, which swaps in a new inode.
+        self.assertEqual((before.st_ino, before.st_mtime_ns), (after.st_ino, after.st_mtime_ns))
+        self.assertEqual(self.path.read_text(encoding="utf-8"), '{"a": 1}')
+
+    def test_external_modification_is_overwritten(self) -> None:
+        write_if_changed(self.path, '{"a": 1}')
+        self.path.write_text('{"a": 12345}', encoding="utf-8")
+        write_if_changed(self.path, '{"a": 1}')
+        self.assertEqual(self.path.read_text(encoding="utf-8"), '{"a": 1}')
+
+    def test_missing_file_and_parent_are_created(self) -> None:
+        write_if_changed(self.path, "first")
+        self.path.unlink()
+        write_if_changed(self.path, "first")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "first")
+
+        nested = Path(self.temp_dir.name) / "sub" / "dir" / "data.json"
+        write_if_changed(nested, "nested")
+        self.assertEqual(nested.read_text(encoding="utf-8"), "nested")
+        self.assertEqual(sorted(p.name for p in nested.parent.iterdir()), ["data.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
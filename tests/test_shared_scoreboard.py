@@ -0,0 +1,46 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(PROJECT_ROOT))
+
+from shared import scoreboard
+
+
+class TestSharedScoreboard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "scores.json"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_load_skips_malformed_entries(self) -> None:
+        raw = [
+            {"name": "ann", "score": 12},
+            {"name": "bob", "score": "40"},
+            {"name": "cat", "score": True},
+            {"name": "dan"},
+            {"score": 7},
+            {"name": "eve", "score": 3, "extra": "kept out"},
+        ]
+        self.path.write_text(json.dumps(raw), encoding="utf-8")
+        self.assertEqual(
+            scoreboard.load_scores(self.path),
+            [scoreboard.ScoreEntry("ann", 12), scoreboard.ScoreEntry("eve", 3)],
+        )
+        scores = scoreboard.add_score(self.path, "fay", 5, limit=2)
+        self.assertEqual([s.name for s in scores], ["ann", "fay"])
+
+    def test_load_missing_or_invalid_file(self) -> None:
+        self.assertEqual(scoreboard.load_scores(self.path), [])
+        self.path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(scoreboard.load_scores(self.path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(PROJECT_ROOT))
+
+from shared import single_instance
+
+
+def _lock_free_in_other_process(path: str) -> bool:
+    """True when a separate process can take the lock, i.e. this process no longer holds it."""
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from shared import single_instance;"
+        "print(single_instance.try_acquire_lock(sys.argv[2]))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, os.fspath(PROJECT_ROOT), path], capture_output=True, text=True, check=True
+    )
+    return out.stdout.strip() == "True"
+
+
+class TestSingleInstanceLock(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.lock_path = os.path.join(self.temp_dir.name, "locks", "game.lock")
+
+    def tearDown(self) -> None:
+        single_instance.release_lock(self.lock_path)
+        self.temp_dir.cleanup()
+
+    def test_spellings_of_one_path_share_the_held_lock(self) -> None:
+        self.assertTrue(single_instance.try_acquire_lock(Path(self.lock_path), label="Tic-Tac-Toe"))
+        dotted = os.path.join(self.temp_dir.name, "locks", "..", "locks", ".", "game.lock")
+        self.assertTrue(single_instance.try_acquire_lock(dotted))
+        self.assertEqual(len([k for k in single_instance._LOCK_HANDLES if k.endswith("game.lock")]), 1)
+        self.assertEqual(single_instance.lock_holder(self.lock_path), "Tic-Tac-Toe")
+        self.assertFalse(_lock_free_in_other_process(self.lock_path))
+
+    def test_release_with_different_spelling(self) -> None:
+        self.assertTrue(single_instance.try_acquire_lock(self.lock_path))
+        cwd = os.getcwd()
+        try:
+            os.chdir(os.path.join(self.temp_dir.name, "locks"))
+            single_instance.release_lock(os.path.join(".", "game.lock"))
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(_lock_free_in_other_process(self.lock_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,10 +10,15 @@ import os
 import sys
 import tkinter as tk
 import atexit
+import concurrent.futures
 import math
 import time
 import random
+import functools
 import glob
+import heapq
+import itertools
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -57,6 +62,77 @@ FONTS_LARGE = {
     "title": ("Segoe UI", 15, "bold"),
 }
 
+# Move-log labels for every (cell, symbol) pair, e.g. (4, "X") -> "X → 2,2".
+_MOVE_LABELS = {
+    (idx, symbol): f"{symbol} \u2192 {idx // 3 + 1},{idx % 3 + 1}" for idx in range(9) for symbol in ("X", "O")
+}
+
+# Sandbox clicks cycle a cell through empty -> X -> O -> empty.
+_SANDBOX_CYCLE = {" ": "X", "X": "O", "O": " "}
+# Palette key used for each placed symbol's foreground.
+_SYMBOL_FG_KEYS = {"X": "ACCENT", "O": "O"}
+_SCORE_FIELDS = itemgetter("X", "O", "Draw")
+
+# ttk styles as (name, {option: palette key}, font key or None, literal options); see _configure_style.
+_STYLE_SPECS = (
+    ("App.TFrame", {"background": "BG"}, None, {}),
+    ("Panel.TFrame", {"background": "PANEL"}, None, {"relief": "flat", "borderwidth": 0}),
+    ("App.TLabel", {"background": "PANEL", "foreground": "TEXT"}, "text", {"padding": (1, 1)}),
+    ("Title.TLabel", {"background": "PANEL", "foreground": "TEXT"}, "title", {"padding": (1, 1)}),
+    ("Banner.TLabel", {"background": "BG", "foreground": "ACCENT"}, "title", {"padding": (2, 1)}),
+    ("Status.TLabel", {"background": "PANEL", "foreground": "ACCENT"}, "title", {"padding": (1, 1)}),
+    ("Muted.TLabel", {"background": "PANEL", "foreground": "MUTED"}, "text", {}),
+    ("App.TCheckbutton", {"background": "PANEL", "foreground": "TEXT", "focuscolor": "PANEL"}, "text", {"padding": 4}),
+    ("Panel.TButton", {"background": "PANEL", "foreground": "TEXT"}, None, {"padding": (10, 8), "borderwidth": 0, "relief": "flat"}),
+    ("Accent.TButton", {"background": "BTN", "foreground": "BG"}, None, {"padding": (12, 10), "borderwidth": 0, "relief": "flat"}),
+    (
+        "App.TCombobox",
+        {"fieldbackground": "PANEL", "background": "PANEL", "foreground": "TEXT"},
+        None,
+        {"padding": 6, "relief": "flat"},
+    ),
+    (
+        "App.TEntry",
+        {"fieldbackground": "PANEL", "background": "PANEL", "foreground": "TEXT", "insertcolor": "ACCENT"},
+        None,
+        {"padding": 6, "relief": "flat"},
+    ),
+)
+# Dynamic ttk state maps as (name, {option: ((state, palette key), ...)}).
+_STYLE_MAPS = (
+    (
+        "Panel.TButton",
+        {"background": (("active", "ACCENT"), ("disabled", "PANEL")), "foreground": (("active", "BG"), ("disabled", "MUTED"))},
+    ),
+    ("Accent.TButton", {"background": (("active", "ACCENT"),), "foreground": (("active", "BG"),)}),
+    (
+        "App.TCombobox",
+        {
+            "fieldbackground": (("disabled", "PANEL"), ("readonly", "PANEL"), ("active", "PANEL")),
+            "background": (("disabled", "PANEL"), ("readonly", "PANEL"), ("active", "PANEL")),
+            "foreground": (("disabled", "TEXT"), ("readonly", "TEXT"), ("active", "TEXT")),
+        },
+    ),
+    ("App.TEntry", {"fieldbackground": (("focus", "PANEL"), ("active", "PANEL")), "foreground": (("disabled", "MUTED"),)}),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_hard_move(board: tuple) -> int:
+    """Memoized ``game.ai_move_hard``; minimax is deterministic, so positions repeat across hints and AI-vs-AI rounds."""
+    return game.ai_move_hard(list(board))
+
+
+def _hard_move_from_list(board: list) -> int:
+    return _cached_hard_move(tuple(board))
+
+
+# AI-vs-AI picker entries, in AI_PLAYERS' declared (easiest-first) order.
+_AI_NAMES = tuple(ai_vs_ai.AI_PLAYERS)
+
+# Deterministic AI movers swapped for their cached form when picked for AI-vs-AI.
+_CACHED_AI_MOVES = {game.ai_move_hard: _hard_move_from_list}
+
 
 class GameSession:
     def __init__(self) -> None:
@@ -65,6 +141,11 @@ class GameSession:
         self.personality = "standard"
         self.ai_move_fn = lambda b: game.ai_move_normal_humanish(b, game.DEFAULT_ERROR_RATE)
         self.board = [" "] * 9
+        # Per-side occupancy bitboards mirroring ``board`` for cheap winner/full checks.
+        self.x_bits = 0
+        self.o_bits = 0
+        # Index into game.WIN_LINES found by the last winner() call, so the GUI need not rescan.
+        self.last_win_line: Optional[int] = None
         self.game_over = False
         self.history = []
         self.moves = []
@@ -88,9 +169,35 @@ class GameSession:
 
     def reset_board(self) -> None:
         self.board = [" "] * 9
+        self.x_bits = 0
+        self.o_bits = 0
+        self.last_win_line = None
         self.game_over = False
         self.moves = []
 
+    def place(self, idx: int, symbol: str) -> None:
+        self.board[idx] = symbol
+        if symbol == "X":
+            self.x_bits |= 1 << idx
+        else:
+            self.o_bits |= 1 << idx
+
+    def clear(self, idx: int) -> None:
+        self.board[idx] = " "
+        self.x_bits &= ~(1 << idx)
+        self.o_bits &= ~(1 << idx)
+        self.last_win_line = None
+
+    def winner(self) -> Optional[str]:
+        line = self.last_win_line = game.win_line_from_bits(self.x_bits, self.o_bits)
+        if line is None:
+            return None
+        mask = game.WIN_MASKS[line]
+        return "X" if self.x_bits & mask == mask else "O"
+
+    def is_full(self) -> bool:
+        return (self.x_bits | self.o_bits) == game.FULL_MASK
+
     def label(self) -> str:
         return game.difficulty_display_label(self.difficulty_key, self.personality)
 
@@ -155,6 +262,8 @@ class TicTacToeGUI:
         self.ai_waiting = False
         self.palette = self._resolve_palette(self.theme_var.get())
         self.fonts = dict(FONTS_LARGE if self.large_fonts.get() else FONTS_DEFAULT)
+        # Resolved ttk style kwargs keyed by (theme, large fonts); see _resolved_style_specs.
+        self._style_cache: dict[tuple, tuple] = {}
         self._configure_style()
         self.session = GameSession()
         self.match_scoreboard = game.load_match_scoreboard()
@@ -165,9 +274,13 @@ class TicTacToeGUI:
         self.match_over = False
         self.match_rounds = 0
         self.options_popup: Optional[tk.Toplevel] = None
+        # (canvas, theme, width) the options swatch was last painted for.
+        self._swatch_key: Optional[tuple] = None
         self.history_popup: Optional[tk.Toplevel] = None
         self.achievements_popup: Optional[tk.Toplevel] = None
         self.ai_vs_ai_popup: Optional[tk.Toplevel] = None
+        # In-memory copy of the AI-vs-AI scoreboard; loaded on first use, written through by _save_ai_scores.
+        self._ai_scores_cache: Optional[dict[str, int]] = None
         self.intro_popup: Optional[tk.Toplevel] = None
         self.change_log_popup: Optional[tk.Toplevel] = None
         self.ai_running = False
@@ -201,8 +314,15 @@ class TicTacToeGUI:
         self.rotate_logs = tk.BooleanVar(value=settings["rotate_logs"])
         self.show_heatmap = tk.BooleanVar(value=settings.get("show_heatmap", False))
         self.humanish_normal = tk.BooleanVar(value=settings.get("humanish_normal", True))
-        self.pending_ai_id: Optional[str] = None
+        # Pending Tk ``after`` ids keyed by purpose ("ai", "save", ...); see _schedule/_cancel.
+        self._timers: dict[str, str] = {}
+        # Animation/AI-vs-AI callbacks as (due perf_counter, seq, fn), drained by _tick on one "tick" timer.
+        self._deferred: list = []
+        self._deferred_seq = itertools.count()
         self.last_move_idx: Optional[int] = None
+        self._log_len = 0
+        # (scoreboard signature, achievement lines) from the last _compute_session_achievements call
+        self._ach_cache: tuple = (None, None)
         self.hint_highlight: Optional[int] = None
         self.rematch_button: Optional[ttk.Button] = None
 
@@ -212,6 +332,10 @@ class TicTacToeGUI:
         self._apply_theme()
         atexit.register(self._shutdown_logger)
         self.root.report_callback_exception = self._handle_exception
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close_app)
+        # History writes run on one worker thread so round end never blocks on disk I/O.
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._closing = False
         self.player_turn = True
         self._build_menu()
         self._apply_compact_layout()
@@ -497,7 +621,7 @@ class TicTacToeGUI:
         game_menu.add_separator()
         game_menu.add_command(label=self._t("menu.ai_mode", "AI vs AI Mode"), command=self._show_ai_vs_ai_popup)
         game_menu.add_separator()
-        game_menu.add_command(label=self._t("menu.exit", "Exit"), command=self.root.quit)
+        game_menu.add_command(label=self._t("menu.exit", "Exit"), command=self._on_close_app)
         menubar.add_cascade(label=self._t("menu.game", "Game"), menu=game_menu)
 
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -631,6 +755,57 @@ class TicTacToeGUI:
             # Show a non-blocking hint if settings cannot be saved.
             self.status_var.set(f"Could not save settings ({exc}).")
 
+    def _schedule(self, key: str, ms: int, fn) -> None:
+        """Run ``fn`` after ``ms`` milliseconds, replacing any timer already pending under ``key``."""
+        self._cancel(key)
+
+        def _fire() -> None:
+            self._timers.pop(key, None)
+            fn()
+
+        self._timers[key] = self.root.after(ms, _fire)
+
+    def _cancel(self, key: str) -> bool:
+        """Cancel the timer pending under ``key``; return True if one was pending."""
+        timer_id = self._timers.pop(key, None)
+        if timer_id is None:
+            return False
+        self.root.after_cancel(timer_id)
+        return True
+
+    def _defer(self, ms: int, fn) -> None:
+        """Queue ``fn`` to run in ``ms`` milliseconds on the shared ticker instead of its own ``after``."""
+        seq = next(self._deferred_seq)
+        heapq.heappush(self._deferred, (time.perf_counter() + ms / 1000, seq, fn))
+        if self._deferred[0][1] == seq:
+            # New earliest deadline: re-arm the single tick timer for it.
+            self._schedule("tick", ms, self._tick)
+
+    def _tick(self) -> None:
+        queue = self._deferred
+        now = time.perf_counter()
+        try:
+            while queue and queue[0][0] <= now:
+                heapq.heappop(queue)[2]()
+        finally:
+            if queue:
+                self._schedule("tick", max(1, math.ceil((queue[0][0] - now) * 1000)), self._tick)
+
+    def _schedule_save(self) -> None:
+        """Coalesce bursts of settings changes into one write 500 ms later."""
+        self._schedule("save", 500, self._save_settings)
+
+    def _flush_pending_save(self) -> None:
+        if self._cancel("save"):
+            self._save_settings()
+
+    def _on_close_app(self) -> None:
+        self._flush_pending_save()
+        self._closing = True
+        # Don't block the Tk thread; queued history writes still finish before interpreter exit.
+        self._io_executor.shutdown(wait=False)
+        self.root.destroy()
+
     def _configure_style(self) -> None:
         self.root.configure(bg=self._color("BG"))
         style = ttk.Style(self.root)
@@ -639,82 +814,40 @@ class TicTacToeGUI:
         except tk.TclError:
             pass
 
-        style.configure("App.TFrame", background=self._color("BG"))
-        style.configure("Panel.TFrame", background=self._color("PANEL"), relief="flat", borderwidth=0)
-        style.configure("App.TLabel", background=self._color("PANEL"), foreground=self._color("TEXT"), font=self._font("text"), padding=(1, 1))
-        style.configure("Title.TLabel", background=self._color("PANEL"), foreground=self._color("TEXT"), font=self._font("title"), padding=(1, 1))
-        style.configure("Banner.TLabel", background=self._color("BG"), foreground=self._color("ACCENT"), font=self._font("title"), padding=(2, 1))
-        style.configure("Status.TLabel", background=self._color("PANEL"), foreground=self._color("ACCENT"), font=self._font("title"), padding=(1, 1))
-        style.configure("Muted.TLabel", background=self._color("PANEL"), foreground=self._color("MUTED"), font=self._font("text"))
-        style.configure(
-            "App.TCheckbutton",
-            background=self._color("PANEL"),
-            foreground=self._color("TEXT"),
-            font=self._font("text"),
-            focuscolor=self._color("PANEL"),
-            padding=4,
-        )
-
-        style.configure("Panel.TButton", padding=(10, 8), background=self._color("PANEL"), foreground=self._color("TEXT"), borderwidth=0, relief="flat")
-        style.map(
-            "Panel.TButton",
-            background=[("active", self._color("ACCENT")), ("disabled", self._color("PANEL"))],
-            foreground=[("active", self._color("BG")), ("disabled", self._color("MUTED"))],
-        )
-
-        style.configure("Accent.TButton", padding=(12, 10), background=self._color("BTN"), foreground=self._color("BG"), borderwidth=0, relief="flat")
-        style.map(
-            "Accent.TButton",
-            background=[("active", self._color("ACCENT"))],
-            foreground=[("active", self._color("BG"))],
-        )
-
-        style.configure(
-            "App.TCombobox",
-            fieldbackground=self._color("PANEL"),
-            background=self._color("PANEL"),
-            foreground=self._color("TEXT"),
-            padding=6,
-            relief="flat",
-        )
-        style.map(
-            "App.TCombobox",
-            fieldbackground=[
-                ("disabled", self._color("PANEL")),
-                ("readonly", self._color("PANEL")),
-                ("active", self._color("PANEL")),
-            ],
-            background=[
-                ("disabled", self._color("PANEL")),
-                ("readonly", self._color("PANEL")),
-                ("active", self._color("PANEL")),
-            ],
-            foreground=[
-                ("disabled", self._color("TEXT")),
-                ("readonly", self._color("TEXT")),
-                ("active", self._color("TEXT")),
-            ],
-        )
-        style.configure(
-            "App.TEntry",
-            fieldbackground=self._color("PANEL"),
-            background=self._color("PANEL"),
-            foreground=self._color("TEXT"),
-            insertcolor=self._color("ACCENT"),
-            padding=6,
-            relief="flat",
-        )
-        style.map(
-            "App.TEntry",
-            fieldbackground=[("focus", self._color("PANEL")), ("active", self._color("PANEL"))],
-            foreground=[("disabled", self._color("MUTED"))],
-        )
+        configures, maps = self._resolved_style_specs()
+        for name, kwargs in configures:
+            style.configure(name, **kwargs)
+        for name, kwargs in maps:
+            style.map(name, **kwargs)
+
+    def _resolved_style_specs(self) -> tuple:
+        """_STYLE_SPECS/_STYLE_MAPS with palette keys and font keys resolved, cached per (theme, font size)."""
+        key = (self.theme_var.get(), self.large_fonts.get())
+        cached = self._style_cache.get(key)
+        if cached is not None:
+            return cached
+        palette, fonts = self.palette, self.fonts
+        configures = []
+        for name, colors, font_key, extras in _STYLE_SPECS:
+            kwargs = {opt: palette[pkey] for opt, pkey in colors.items()}
+            if font_key:
+                kwargs["font"] = fonts[font_key]
+            kwargs.update(extras)
+            configures.append((name, kwargs))
+        maps = [
+            (name, {opt: [(state, palette[pkey]) for state, pkey in states] for opt, states in spec.items()})
+            for name, spec in _STYLE_MAPS
+        ]
+        cached = self._style_cache[key] = (configures, maps)
+        return cached
 
     def _apply_theme(self) -> None:
         self.palette = self._resolve_palette(self.theme_var.get())
         self.fonts = dict(FONTS_LARGE if self.large_fonts.get() else FONTS_DEFAULT)
         self._configure_style()
         self._apply_compact_layout()
+        self._build_heatmap_lut()
+        self._build_hover_table()
 
         for row in self.buttons:
             for btn in row:
@@ -773,9 +906,18 @@ class TicTacToeGUI:
             getattr(self, "history_popup", None),
             getattr(self, "achievements_popup", None),
             getattr(self, "change_log_popup", None),
+            getattr(self, "ai_vs_ai_popup", None),
         ):
             if popup and popup.winfo_exists():
                 self._retint_popup(popup)
+        # Reused (withdrawn) popups keep widgets built under the old palette/fonts, and
+        # their tk widgets sit below frames that _retint_popup does not descend into.
+        popup = getattr(self, "achievements_popup", None)
+        if popup and popup.winfo_exists():
+            self._ach_canvas.configure(bg=self._color("PANEL"))
+        popup = getattr(self, "ai_vs_ai_popup", None)
+        if popup and popup.winfo_exists():
+            self._restyle_ai_vs_ai_popup()
 
     def _retint_popup(self, popup: tk.Toplevel) -> None:
         popup.configure(bg=self._color("BG"))
@@ -794,10 +936,7 @@ class TicTacToeGUI:
         popup = getattr(self, "options_popup", None)
         if not popup or not popup.winfo_exists():
             return
-        popup.configure(bg=self._color("BG"))
-        for child in popup.winfo_children():
-            if isinstance(child, tk.Canvas):
-                child.configure(bg=self._color("PANEL"))
+        popup.restyle()
 
     def _show_whats_new_popup(self) -> None:
         msg = (
@@ -829,6 +968,8 @@ class TicTacToeGUI:
         self.pause_ai_btn.configure(text=self._t("button.pause_ai", "Pause AI"))
         self.hint_btn.configure(text=self._t("button.hint", "Hint"))
         self.undo_btn.configure(text=self._t("button.undo_move", "Undo Move"))
+        self.view_history_btn.configure(text=self._t("button.view_history", "View history"))
+        self.achievements_btn.configure(text=self._t("button.achievements", "Achievements"))
         self.clean_slate_btn.configure(text=self._t("button.clean_slate", "Clean slate"))
         self.ai_mode_btn.configure(text=self._t("button.ai_mode", "AI vs AI Mode"))
         self.moves_label.configure(text=self._t("label.moves_log", "Moves"))
@@ -919,33 +1060,35 @@ class TicTacToeGUI:
         self._apply_theme()
 
     def _toggle_confirm(self) -> None:
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_auto_start(self) -> None:
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_rotate_logs(self) -> None:
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_animations(self) -> None:
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_sound(self) -> None:
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_show_coords(self) -> None:
         self._refresh_board()
-        self._save_settings()
+        self._schedule_save()
 
     def _toggle_heatmap(self) -> None:
         self.heatmap_locked = False
         self._refresh_board()
-        self._save_settings()
+        if self.show_heatmap.get() and not self.session.game_over:
+            self._refresh_heatmap()
+        self._schedule_save()
 
     def _disable_motion_sound(self) -> None:
         self.animations_enabled.set(False)
         self.sound_enabled.set(False)
-        self._save_settings()
+        self._schedule_save()
 
     def _reset_toggles(self) -> None:
         self.confirm_moves.set(True)
@@ -957,7 +1100,7 @@ class TicTacToeGUI:
         self.show_coords.set(False)
         self.compact_sidebar.set(False)
         self.show_intro_overlay.set(True)
-        self._save_settings()
+        self._schedule_save()
         self._apply_compact_layout()
 
     def _toggle_ai_pause_main(self) -> None:
@@ -965,12 +1108,7 @@ class TicTacToeGUI:
         if self.ai_paused_main:
             if hasattr(self, "pause_ai_btn"):
                 self.pause_ai_btn.configure(text="Resume AI")
-            if self.pending_ai_id:
-                try:
-                    self.root.after_cancel(self.pending_ai_id)
-                except Exception:
-                    pass
-                self.pending_ai_id = None
+            if self._cancel("ai"):
                 self.ai_waiting = True
             self.status_var.set("AI paused. Resume to continue.")
         else:
@@ -980,7 +1118,7 @@ class TicTacToeGUI:
                 self.ai_waiting = False
                 self.status_var.set("AI resuming...")
                 self._set_status_icon("ai")
-                self.pending_ai_id = self.root.after(50, self._ai_move)
+                self._schedule("ai", 50, self._ai_move)
 
     def _toggle_sandbox(self) -> None:
         self.sandbox_mode = not getattr(self, "sandbox_mode", False)
@@ -1025,14 +1163,7 @@ class TicTacToeGUI:
     def _on_theme_change(self, _event=None) -> None:
         self._apply_theme()
         if self.options_popup and self.options_popup.winfo_exists():
-            swatch = None
-            for child in self.options_popup.winfo_children():
-                for grand in child.winfo_children():
-                    if isinstance(grand, tk.Canvas):
-                        swatch = grand
-                        break
-            if swatch:
-                self._update_theme_swatch(swatch)
+            self._update_theme_swatch(self.options_popup.swatch)
     def _on_language_change(self, lang: str) -> None:
         self._load_translations(lang)
         self._build_menu()
@@ -1041,9 +1172,14 @@ class TicTacToeGUI:
         self._refresh_localized_text()
 
     def _update_theme_swatch(self, canvas: tk.Canvas) -> None:
+        width = canvas.winfo_width() or 200
+        key = (str(canvas), self.theme_var.get(), width)
+        if key == self._swatch_key:
+            # Reopening Options without a theme change or resize leaves the swatch as drawn.
+            return
+        self._swatch_key = key
         canvas.delete("all")
         colors = [self._color(k) for k in ("BG", "PANEL", "ACCENT", "TEXT", "O")]
-        width = canvas.winfo_width() or 200
         segment = width // len(colors)
         for i, col in enumerate(colors):
             canvas.create_rectangle(i * segment, 0, (i + 1) * segment, 20, fill=col, outline=col)
@@ -1084,14 +1220,17 @@ class TicTacToeGUI:
 
         btn_bar = ttk.Frame(top, style="App.TFrame")
         btn_bar.grid(row=0, column=4, columnspan=2, sticky="e")
-        self.start_btn = ttk.Button(btn_bar, text=self._t("button.new_game", "New Game"), command=self.start_new_game, style="Accent.TButton")
-        self.start_btn.grid(row=0, column=0, padx=(0, 4))
-        self.reset_btn = ttk.Button(btn_bar, text=self._t("button.reset_scoreboard", "Reset Scoreboard"), command=self._reset_scoreboard, style="Panel.TButton")
-        self.reset_btn.grid(row=0, column=1, padx=(4, 0))
-        self.rematch_button = ttk.Button(btn_bar, text=self._t("button.rematch", "Rematch"), command=self._rematch_same_settings, style="Panel.TButton")
-        self.rematch_button.grid(row=0, column=2, padx=(4, 0))
-        self.pause_ai_btn = ttk.Button(btn_bar, text=self._t("button.pause_ai", "Pause AI"), command=self._toggle_ai_pause_main, style="Panel.TButton")
-        self.pause_ai_btn.grid(row=0, column=3, padx=(4, 0))
+        # (attribute, translation key, default label, command, style)
+        control_specs = (
+            ("start_btn", "button.new_game", "New Game", self.start_new_game, "Accent.TButton"),
+            ("reset_btn", "button.reset_scoreboard", "Reset Scoreboard", self._reset_scoreboard, "Panel.TButton"),
+            ("rematch_button", "button.rematch", "Rematch", self._rematch_same_settings, "Panel.TButton"),
+            ("pause_ai_btn", "button.pause_ai", "Pause AI", self._toggle_ai_pause_main, "Panel.TButton"),
+        )
+        for col, (attr, key, default, cmd, style) in enumerate(control_specs):
+            btn = ttk.Button(btn_bar, text=self._t(key, default), command=cmd, style=style)
+            btn.grid(row=0, column=col, padx=(0, 4) if col == 0 else (4, 0))
+            setattr(self, attr, btn)
 
         match_row = ttk.Frame(top, style="App.TFrame")
         match_row.grid(row=1, column=0, columnspan=6, sticky="ew", pady=(6, 0))
@@ -1116,6 +1255,8 @@ class TicTacToeGUI:
         self.board_title.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 6))
 
         self.buttons = []
+        # Hot repaint paths call Tcl directly with the widget path (btn._w).
+        self._tk_call = self.root.tk.call
         for r in range(3):
             row_buttons = []
             for c in range(3):
@@ -1139,11 +1280,14 @@ class TicTacToeGUI:
                   )
                 btn.default_bg = self._color("CELL")  # type: ignore[attr-defined]
                 btn.default_fg = self._color("TEXT")  # type: ignore[attr-defined]
+                btn._val = " "  # type: ignore[attr-defined]
                 btn.bind("<Enter>", lambda _e, b=btn: self._hover_on(b))
                 btn.bind("<Leave>", lambda _e, b=btn: self._hover_off(b))
                 btn.grid(row=r + 1, column=c, padx=6, pady=6, sticky="nsew")
                 row_buttons.append(btn)
             self.buttons.append(row_buttons)
+        # Row-major view of the grid so per-cell paths index by board position directly.
+        self._buttons_flat = tuple(btn for row in self.buttons for btn in row)
 
         # Live move log under the board.
         log_frame = ttk.Frame(board_frame, style="App.TFrame")
@@ -1233,6 +1377,18 @@ class TicTacToeGUI:
         records = ttk.Frame(info, style="Panel.TFrame")
         records.grid(row=15, column=0, sticky="ew", pady=(6, 2))
         records.columnconfigure((0, 1), weight=1)
+        # (attribute, translation key, default label, command), laid out two per row.
+        record_specs = (
+            ("view_history_btn", "button.view_history", "View history", self._view_history_popup),
+            ("achievements_btn", "button.achievements", "Achievements", self._show_achievements_popup),
+            ("clean_slate_btn", "button.clean_slate", "Clean slate", self._clean_slate),
+            ("ai_mode_btn", "button.ai_mode", "AI vs AI Mode", self._show_ai_vs_ai_popup),
+        )
+        for i, (attr, key, default, cmd) in enumerate(record_specs):
+            r, c = divmod(i, 2)
+            btn = ttk.Button(records, text=self._t(key, default), style="Panel.TButton", command=cmd)
+            btn.grid(row=r, column=c, sticky="ew", padx=3, pady=2)
+            setattr(self, attr, btn)
 
     def _on_diff_change(self, _event=None) -> None:
         self._apply_selection()
@@ -1241,19 +1397,36 @@ class TicTacToeGUI:
         self._apply_selection()
 
     def _format_move(self, move: tuple[int, str]) -> str:
-        idx, symbol = move
-        r, c = divmod(idx, 3)
-        return f"{symbol} \u2192 {r + 1},{c + 1}"
+        return _MOVE_LABELS[move]
 
     def _refresh_move_log(self) -> None:
         if not hasattr(self, "move_listbox"):
             return
-        self.move_listbox.delete(0, tk.END)
-        for i, (idx, symbol) in enumerate(self.session.moves, start=1):
-            self.move_listbox.insert(tk.END, f"{i}. {self._format_move((idx, symbol))}")
-        if self.session.moves:
+        moves = self.session.moves
+        # Only touch the rows that changed: trim after undo/new game, append new moves.
+        if len(moves) < self._log_len:
+            self.move_listbox.delete(len(moves), tk.END)
+            self._log_len = len(moves)
+        for i in range(self._log_len, len(moves)):
+            self.move_listbox.insert(tk.END, f"{i + 1}. {_MOVE_LABELS[moves[i]]}")
+        self._log_len = len(moves)
+        if moves:
             self.move_listbox.see(tk.END)
 
+    def _build_heatmap_lut(self) -> None:
+        """Precompute the 256-step cell-to-accent gradient used by the heatmap."""
+
+        def to_rgb(hex_color: str):
+            return tuple(int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
+
+        # blend from muted to accent for better-for-AI moves
+        base = to_rgb(self._color("CELL"))
+        accent = to_rgb(self._color("ACCENT"))
+        self._heatmap_lut = [
+            "#%02x%02x%02x" % tuple(int(base[k] + (accent[k] - base[k]) * i / 255) for k in range(3))
+            for i in range(256)
+        ]
+
     def _refresh_heatmap(self) -> None:
         if getattr(self, "heatmap_locked", False):
             return
@@ -1278,28 +1451,11 @@ class TicTacToeGUI:
         min_score = min(numeric_scores)
         span = max_score - min_score if max_score != min_score else 1
 
-        def color_for(val: int) -> str:
-            norm = (val - min_score) / span
-            # blend from muted to accent for better-for-AI moves
-            def lerp(a, b):
-                return int(a + (b - a) * norm)
-
-            def to_rgb(hex_color: str):
-                return tuple(int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
-
-            base = to_rgb(self._color("CELL"))
-            accent = to_rgb(self._color("ACCENT"))
-            r = lerp(base[0], accent[0])
-            g = lerp(base[1], accent[1])
-            b = lerp(base[2], accent[2])
-            return f"#{r:02x}{g:02x}{b:02x}"
-
+        lut = self._heatmap_lut
         for idx, val in enumerate(scores):
             if val is None:
                 continue
-            r, c = divmod(idx, 3)
-            btn = self.buttons[r][c]
-            btn.configure(bg=color_for(val))
+            self._buttons_flat[idx].configure(bg=lut[int((val - min_score) * 255 / span)])
 
         # keep overlay until player makes a move
         self.heatmap_locked = True
@@ -1353,60 +1509,58 @@ class TicTacToeGUI:
             self._refresh_scoreboard()
             self.status_var.set("Badges and history reset.")
 
+    def _refresh_cell(self, idx: int) -> None:
+        val = self.session.board[idx]
+        btn = self._buttons_flat[idx]
+        text = f"{idx // 3 + 1},{idx % 3 + 1}" if val == " " and self.show_coords.get() else val
+        fg = self._color(_SYMBOL_FG_KEYS.get(val, "TEXT"))
+        # Single raw Tcl configure per cell; skips Misc.configure's option normalisation.
+        self._tk_call(btn._w, "configure", "-text", text, "-fg", fg, "-bg", btn.default_bg)
+        btn._val = val  # type: ignore[attr-defined]
+
     def _refresh_board(self) -> None:
-        for r in range(3):
-            for c in range(3):
-                idx = r * 3 + c
-                val = self.session.board[idx]
-                btn = self.buttons[r][c]
-                if val == " " and self.show_coords.get():
-                    btn["text"] = f"{r+1},{c+1}"
-                else:
-                    btn["text"] = val
-                if val == "X":
-                    btn.configure(fg=self._color("ACCENT"), bg=btn.default_bg)
-                elif val == "O":
-                    btn.configure(fg=self._color("O"), bg=btn.default_bg)
-                else:
-                    btn.configure(fg=self._color("TEXT"), bg=btn.default_bg)
-        if self.show_heatmap.get() and not self.session.game_over:
-            self._refresh_heatmap()
+        # Heatmap overlay is repainted explicitly at turn boundaries, not on every redraw.
+        for idx in range(9):
+            self._refresh_cell(idx)
+
+    def _build_hover_table(self) -> None:
+        """Precompute Tcl configure args keyed by (animations, cell value, entering)."""
+        accent = self._color("ACCENT")
+        table = {}
+        for val in (" ", "X", "O"):
+            fg = self._color(_SYMBOL_FG_KEYS.get(val, "TEXT"))
+            table[(False, val, False)] = ("-highlightbackground", accent, "-highlightthickness", 1)
+            table[(True, val, False)] = ("-bg", self._color("CELL"), "-fg", fg, "-relief", "raised")
+        # Only blank cells react when the pointer enters (see _hover_on for coordinate labels).
+        table[(False, " ", True)] = ("-highlightbackground", accent, "-highlightthickness", 2)
+        table[(True, " ", True)] = ("-bg", accent, "-fg", self._color("BG"), "-relief", "solid")
+        self._hover_table = table
 
     def _hover_on(self, btn: tk.Button) -> None:
-        if not self.animations_enabled.get():
-            if btn["text"] == " ":
-                btn.configure(highlightbackground=self._color("ACCENT"), highlightthickness=2)
-            return
-        if btn["text"] == " ":
-            btn.configure(bg=self._color("ACCENT"), fg=self._color("BG"), relief="solid")
+        if btn._val == " " and self.show_coords.get():
+            return  # cell is labelled with its coordinate, not blank; it never took the hover accent
+        args = self._hover_table.get((self.animations_enabled.get(), btn._val, True))
+        if args:
+            self._tk_call(btn._w, "configure", *args)
 
     def _hover_off(self, btn: tk.Button) -> None:
-        if not self.animations_enabled.get():
-            btn.configure(highlightbackground=self._color("ACCENT"), highlightthickness=1)
-            return
-        val = btn["text"]
-        if val == "X":
-            btn.configure(bg=btn.default_bg, fg=self._color("ACCENT"), relief="raised")
-        elif val == "O":
-            btn.configure(bg=btn.default_bg, fg=self._color("O"), relief="raised")
-        else:
-            btn.configure(bg=btn.default_bg, fg=btn.default_fg, relief="raised")
+        args = self._hover_table.get((self.animations_enabled.get(), btn._val, False))
+        if args:
+            self._tk_call(btn._w, "configure", *args)
 
     def _refresh_scoreboard(self) -> None:
         sb = self.session.scoreboard
-        lines = []
-        for diff in game.DIFFICULTIES:
-            entry = sb.get(diff, game.DEFAULT_SCORE)
-            label = self._display_difficulty_label(diff)
-            lines.append(f"{label}: X={entry['X']}  O={entry['O']}  {self._t('score.draws','Draws')}={entry['Draw']}")
-        self.score_var.set("\n".join(lines))
-
         msb = getattr(self, "match_scoreboard", {})
-        match_lines = []
-        for diff in game.DIFFICULTIES:
-            entry = msb.get(diff, game.DEFAULT_SCORE)
+        draws = self._t("score.draws", "Draws")
+        lines = [None] * len(game.DIFFICULTIES)
+        match_lines = [None] * len(game.DIFFICULTIES)
+        for i, diff in enumerate(game.DIFFICULTIES):
             label = self._display_difficulty_label(diff)
-            match_lines.append(f"{label}: X={entry['X']}  O={entry['O']}  {self._t('score.draws','Draws')}={entry['Draw']}")
+            x, o, d = _SCORE_FIELDS(sb.get(diff, game.DEFAULT_SCORE))
+            lines[i] = f"{label}: X={x}  O={o}  {draws}={d}"
+            x, o, d = _SCORE_FIELDS(msb.get(diff, game.DEFAULT_SCORE))
+            match_lines[i] = f"{label}: X={x}  O={o}  {draws}={d}"
+        self.score_var.set("\n".join(lines))
         self.match_score_var.set("\n".join(match_lines) if match_lines else "No matches yet.")
         badge_lines = []
         for diff, info in self.badges.items():
@@ -1432,18 +1586,17 @@ class TicTacToeGUI:
             self.history_var.set(f"{self._t('score.recent','Recent')}: " + " | ".join(parsed))
         else:
             self.history_var.set(f"{self._t('score.recent','Recent')}: {self._t('score.recent_none','none')}")
-        # Update achievements popup if open
-        if self.achievements_popup and self.achievements_popup.winfo_exists():
-            self._populate_achievements(self.achievements_popup)
+        # Update achievements popup if open; a hidden one is repopulated when reshown.
+        popup = self.achievements_popup
+        if popup and popup.winfo_exists() and popup.state() != "withdrawn":
+            self._refresh_achievements()
 
         self._refresh_quick_stats()
 
     def start_new_game(self) -> None:
         if getattr(self, "match_over", False):
             self._new_match()
-        if self.pending_ai_id:
-            self.root.after_cancel(self.pending_ai_id)
-            self.pending_ai_id = None
+        self._cancel("ai")
         self.sandbox_mode = False
         if self.sandbox_btn:
             if self.session.difficulty_key == "Normal":
@@ -1473,9 +1626,7 @@ class TicTacToeGUI:
 
     def _handle_player_move(self, idx: int) -> None:
         if self.sandbox_mode:
-            current = self.sandbox_board[idx]
-            new_val = "X" if current == " " else "O" if current == "X" else " "
-            self.sandbox_board[idx] = new_val
+            self.sandbox_board[idx] = _SANDBOX_CYCLE[self.sandbox_board[idx]]
             # reflect on board buttons
             self.session.board = self.sandbox_board[:]
             self._refresh_board()
@@ -1491,18 +1642,18 @@ class TicTacToeGUI:
                 return
         self.last_move_idx = idx
 
-        if self.pending_ai_id:
-            self.root.after_cancel(self.pending_ai_id)
-            self.pending_ai_id = None
+        self._cancel("ai")
 
-        self.session.board[idx] = "X"
+        self.session.place(idx, "X")
         self.session.moves.append((idx, "X"))
         self._refresh_move_log()
-        self._refresh_board()
-        winner = game.check_winner(self.session.board)
-        if winner or game.board_full(self.session.board):
+        self._refresh_cell(idx)
+        winner = self.session.winner()
+        if winner or self.session.is_full():
             self._finish_round(winner or "Draw")
             return
+        if self.show_heatmap.get():
+            self._refresh_heatmap()
 
         self.status_var.set(self._t("status.ai_thinking", "AI is thinking..."))
         self._set_status_icon("ai")
@@ -1511,7 +1662,7 @@ class TicTacToeGUI:
             self.ai_waiting = True
             self.status_var.set(self._t("status.ai_paused", "AI paused. Resume to continue."))
         else:
-            self.pending_ai_id = self.root.after(250, self._ai_move)
+            self._schedule("ai", 250, self._ai_move)
 
     def _ai_move(self) -> None:
         if self.session.game_over:
@@ -1521,17 +1672,16 @@ class TicTacToeGUI:
             self.status_var.set(self._t("status.ai_paused", "AI paused. Resume to continue."))
             return
         ai_idx = self.session.ai_move_fn(self.session.board)
-        self.session.board[ai_idx] = "O"
+        self.session.place(ai_idx, "O")
         self.session.moves.append((ai_idx, "O"))
         self._refresh_move_log()
-        self._refresh_board()
+        self._refresh_cell(ai_idx)
         self._flash_ai_move(ai_idx)
         if self.show_commentary.get():
             self.status_var.set(self._commentary_for_ai_move(ai_idx))
-        self.pending_ai_id = None
         self.last_move_idx = None
-        winner = game.check_winner(self.session.board)
-        if winner or game.board_full(self.session.board):
+        winner = self.session.winner()
+        if winner or self.session.is_full():
             self._finish_round(winner or "Draw")
             return
         self.status_var.set(self._t("status.your_turn", "Your turn."))
@@ -1579,9 +1729,12 @@ class TicTacToeGUI:
 
     def _refresh_quick_stats(self) -> None:
         sb = self.session.scoreboard
-        x_total = sum(sb.get(diff, {}).get("X", 0) for diff in game.DIFFICULTIES)
-        o_total = sum(sb.get(diff, {}).get("O", 0) for diff in game.DIFFICULTIES)
-        d_total = sum(sb.get(diff, {}).get("Draw", 0) for diff in game.DIFFICULTIES)
+        x_total = o_total = d_total = 0
+        for diff in game.DIFFICULTIES:
+            entry = sb.get(diff) or game.DEFAULT_SCORE
+            x_total += entry.get("X", 0)
+            o_total += entry.get("O", 0)
+            d_total += entry.get("Draw", 0)
         games = x_total + o_total + d_total
         match_line = (
             f"{self._t('score.match_prefix','Match')}: Bo{self.match_length}, {self._t('score.round','Round')} {self.match_rounds + (0 if self.match_over else 1)}/{self.match_length} "
@@ -1615,11 +1768,19 @@ class TicTacToeGUI:
 
     def _commentary_for_ai_move(self, idx: int) -> str:
         board = self.session.board
+        # Temporarily lift the AI's piece to see what the square meant before it moved.
+        original = board[idx]
+        board[idx] = " "
+        try:
+            won = game.find_winning_move(board, "O") == idx
+            blocked = not won and game.find_winning_move(board, "X") == idx
+        finally:
+            board[idx] = original
         # If AI just won
-        if game.find_winning_move([c if i != idx else " " for i, c in enumerate(board)], "O") == idx:
+        if won:
             return "AI saw a winning line."
         # If AI blocked
-        if game.find_winning_move([c if i != idx else " " for i, c in enumerate(board)], "X") == idx:
+        if blocked:
             return "AI blocked your threat."
         # Preferred center/corner logic
         if idx == 4:
@@ -1636,12 +1797,7 @@ class TicTacToeGUI:
             self.status_var.set(self._t("status.match_end", "{winner} wins! Start a new game.").replace("{winner}", self._session_label_localized()))
         self._set_status_icon("done")
         self.session.record_result(winner)
-        elapsed = None
-        if self.round_start_time:
-            try:
-                elapsed = time.perf_counter() - self.round_start_time
-            except Exception:
-                elapsed = None
+        elapsed = time.perf_counter() - self.round_start_time if self.round_start_time else None
         self._update_match_progress(winner)
         self._highlight_winning_line(winner)
         self._refresh_scoreboard()
@@ -1661,50 +1817,43 @@ class TicTacToeGUI:
                 self.root.after(600, self.start_new_game)
         self._play_sound()
         # history auto-saved at end of round
-        self._log_user_event(f"Round finished ({winner}) in {elapsed:.2f}s" if elapsed else f"Round finished ({winner})")
+        msg = f"Round finished ({winner}) in {elapsed:.2f}s" if elapsed is not None else f"Round finished ({winner})"
+        self._log_user_event(msg)
 
     def _flash_ai_move(self, idx: int) -> None:
         if not self.animations_enabled.get():
             return
-        r, c = divmod(idx, 3)
-        btn = self.buttons[r][c]
+        btn = self._buttons_flat[idx]
         original = btn.cget("bg")
-        btn.configure(bg=self._color("ACCENT"), fg=self._color("BG"), relief="solid")
-        self.root.after(220, lambda: btn.configure(bg=original, fg=self._color("O"), relief="raised"))
+        accent, bg, o_fg = self._color("ACCENT"), self._color("BG"), self._color("O")
+        btn.configure(bg=accent, fg=bg, relief="solid")
+        self._defer(220, lambda: btn.configure(bg=original, fg=o_fg, relief="raised"))
 
     def _highlight_winning_line(self, winner: str) -> None:
-        if winner == "Draw":
+        line = self.session.last_win_line
+        if winner == "Draw" or line is None:
             return
-        lines = [
-            (0, 1, 2),
-            (3, 4, 5),
-            (6, 7, 8),
-            (0, 3, 6),
-            (1, 4, 7),
-            (2, 5, 8),
-            (0, 4, 8),
-            (2, 4, 6),
-        ]
-        for a, b, c in lines:
-            if self.session.board[a] == self.session.board[b] == self.session.board[c] == winner:
-                for idx in (a, b, c):
-                    r, col = divmod(idx, 3)
-                    btn = self.buttons[r][col]
-                    btn.configure(bg=self._color("BTN"), fg=self._color("BG"))
-                break
+        bg, fg = self._color("BTN"), self._color("BG")
+        for idx in game.WIN_LINES[line]:
+            self._buttons_flat[idx].configure(bg=bg, fg=fg)
 
     def _celebrate_win(self) -> None:
         if not self.animations_enabled.get():
             return
         colors = [self._color("ACCENT"), self._color("BTN"), self._color("O")]
+        paths = [btn._w for btn in self._buttons_flat]
+        # Draw every frame's colours up front: five frames of nine cells.
+        seq = random.choices(colors, k=5 * 9)
+        tk_call = self._tk_call
         def _flash(count: int = 0) -> None:
             if count >= 5:
                 self._refresh_board()
                 return
-            for row in self.buttons:
-                for btn in row:
-                    btn.configure(bg=random.choice(colors))
-            self.root.after(120, lambda: _flash(count + 1))
+            base = count * 9
+            # Raw Tcl configures; Tk coalesces the nine repaints into one idle redraw.
+            for i, path in enumerate(paths):
+                tk_call(path, "configure", "-bg", seq[base + i])
+            self._defer(120, lambda: _flash(count + 1))
         _flash()
 
     def _commiserate_loss(self) -> None:
@@ -1712,59 +1861,65 @@ class TicTacToeGUI:
         if not self.animations_enabled.get():
             return
         palette = [self._color("BG"), self._color("PANEL"), self._color("BTN")]
+        text_fg = self._color("TEXT")
+        paths = [btn._w for btn in self._buttons_flat]
+        tk_call = self._tk_call
         def _wash(count: int = 0) -> None:
             if count >= 4:
                 self._refresh_board()
                 return
             shade = palette[count % len(palette)]
-            for row in self.buttons:
-                for btn in row:
-                    btn.configure(bg=shade, fg=self._color("TEXT"))
-            self.root.after(140, lambda: _wash(count + 1))
+            for path in paths:
+                tk_call(path, "configure", "-bg", shade, "-fg", text_fg)
+            self._defer(140, lambda: _wash(count + 1))
         _wash()
 
     def _undo_move(self) -> None:
         if self.session.game_over:
             return
-        if self.pending_ai_id:
-            self.root.after_cancel(self.pending_ai_id)
-            self.pending_ai_id = None
+        self._cancel("ai")
         if not self.session.moves:
             return
 
-        def _pop_and_clear() -> None:
+        def _pop_and_clear() -> int:
             idx, _ = self.session.moves.pop()
-            self.session.board[idx] = " "
+            self.session.clear(idx)
+            return idx
 
         last_symbol = self.session.moves[-1][1]
-        _pop_and_clear()
+        changed = [_pop_and_clear()]
         # If we just removed an AI move, also remove the preceding player move so turn returns to player.
         if last_symbol == "O" and self.session.moves and self.session.moves[-1][1] == "X":
-            _pop_and_clear()
+            changed.append(_pop_and_clear())
 
         self.last_move_idx = None
         self.session.game_over = False
         self.player_turn = True
         self.status_var.set("Move undone. Your turn.")
         self._set_status_icon("player")
-        self._refresh_board()
+        if self.show_heatmap.get():
+            # Heatmap tints every cell; clear the whole overlay as before.
+            self._refresh_board()
+        else:
+            for idx in changed:
+                self._refresh_cell(idx)
         self._refresh_move_log()
 
     def _show_hint(self) -> None:
         if self.sandbox_mode:
-            board_copy = self.sandbox_board[:]
+            board = tuple(self.sandbox_board)
         else:
             if self.session.game_over:
                 return
-            board_copy = self.session.board[:]
-        open_spots = [i for i, v in enumerate(board_copy) if v == " "]
-        if not open_spots:
+            board = tuple(self.session.board)
+        if " " not in board:
             return
-        hint_idx = game.ai_move_hard(board_copy)
+        hint_idx = _cached_hard_move(board)
         r, c = divmod(hint_idx, 3)
-        btn = self.buttons[r][c]
+        btn = self._buttons_flat[hint_idx]
         btn.configure(bg=self._color("O"), fg=self._color("BG"), relief="solid")
-        self.root.after(300, lambda: self._refresh_board())
+        # Keyed timer: repeated hints replace the pending revert instead of stacking board redraws.
+        self._schedule("hint", 300, self._refresh_board)
         self.status_var.set(f"Hint: consider row {r + 1}, column {c + 1}.")
 
     def _view_history_popup(self) -> None:
@@ -1799,9 +1954,12 @@ class TicTacToeGUI:
     def _compute_session_achievements(self) -> list:
         # Lifetime achievements based on persisted scoreboard
         sb = self.session.scoreboard
-        total_wins = sum(entry.get("X", 0) for entry in sb.values())
-        total_games = sum(entry.get("X", 0) + entry.get("O", 0) + entry.get("Draw", 0) for entry in sb.values())
-        total_draws = sum(entry.get("Draw", 0) for entry in sb.values())
+        total_wins = total_games = total_draws = 0
+        for entry in sb.values():
+            x, o, d = entry.get("X", 0), entry.get("O", 0), entry.get("Draw", 0)
+            total_wins += x
+            total_draws += d
+            total_games += x + o + d
 
         hard = sb.get("Hard", game.DEFAULT_SCORE)
         normal = sb.get("Normal", game.DEFAULT_SCORE)
@@ -1814,6 +1972,11 @@ class TicTacToeGUI:
         normal_draws = normal.get("Draw", 0)
         easy_draws = easy.get("Draw", 0)
 
+        sig = (total_wins, total_games, total_draws, hard_wins, normal_wins, easy_wins, hard_draws, normal_draws, easy_draws)
+        cached_sig, cached_items = self._ach_cache
+        if cached_sig == sig:
+            return cached_items
+
         defs = [
             # Wins & games
             ("First win!", total_wins >= 1),
@@ -1847,11 +2010,10 @@ class TicTacToeGUI:
         items = earned + locked
         if not items:
             items = ["(locked) Achievements will appear as you play."]
+        self._ach_cache = (sig, items)
         return items
 
-    def _populate_achievements(self, popup: tk.Toplevel) -> None:
-        for child in popup.winfo_children():
-            child.destroy()
+    def _build_achievements_widgets(self, popup: tk.Toplevel) -> None:
         ttk.Label(popup, text="Achievements (lifetime)", style="Title.TLabel").pack(anchor="w", padx=10, pady=(8, 4))
         container = ttk.Frame(popup, style="Panel.TFrame")
         container.pack(fill="both", expand=True, padx=10, pady=4)
@@ -1868,27 +2030,45 @@ class TicTacToeGUI:
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        self._ach_canvas = canvas
+        self._ach_frame = frame
+        # One label per achievement line; labels[:_ach_visible] are packed, in order.
+        self._ach_labels: list = []
+        self._ach_visible = 0
 
+    def _refresh_achievements(self) -> None:
         achievements = self._compute_session_achievements()
         if self.achievements_filter_earned.get():
             achievements = [a for a in achievements if not a.startswith("(locked)")]
-        for item in achievements:
-            ttk.Label(frame, text=f"- {item}", style="App.TLabel", wraplength=320, justify="left").pack(anchor="w", pady=2)
-        frame.update_idletasks()
-        if self.achievements_popup and achievements:
+        labels = self._ach_labels
+        while len(labels) < len(achievements):
+            labels.append(ttk.Label(self._ach_frame, style="App.TLabel", wraplength=320, justify="left"))
+        for lbl, item in zip(labels, achievements):
+            lbl.configure(text=f"- {item}")
+        shown = len(achievements)
+        # Shown labels are always a prefix, so packing/forgetting the tail keeps their order.
+        for lbl in labels[self._ach_visible:shown]:
+            lbl.pack(anchor="w", pady=2)
+        for lbl in labels[shown:self._ach_visible]:
+            lbl.pack_forget()
+        self._ach_visible = shown
+        self._ach_frame.update_idletasks()
+        if achievements:
             try:
                 first_locked_idx = next(i for i, a in enumerate(achievements) if a.startswith("(locked)"))
-                canvas = frame.nametowidget(frame.winfo_parent())
-                total = len(achievements)
-                if total:
-                    canvas.yview_moveto(first_locked_idx / max(1, total))
+                self._ach_canvas.yview_moveto(first_locked_idx / len(achievements))
             except StopIteration:
                 pass
 
     def _show_achievements_popup(self) -> None:
-        if self.achievements_popup and self.achievements_popup.winfo_exists():
-            self.achievements_popup.lift()
-            self.achievements_popup.focus_set()
+        existing = self.achievements_popup
+        if existing and existing.winfo_exists():
+            # Reuse the hidden window instead of rebuilding its widget tree.
+            if existing.state() == "withdrawn":
+                existing.deiconify()
+                self._refresh_achievements()
+            existing.lift()
+            existing.focus_set()
             return
         popup = tk.Toplevel(self.root)
         popup.title("Achievements")
@@ -1902,24 +2082,40 @@ class TicTacToeGUI:
             text="Show earned only",
             variable=self.achievements_filter_earned,
             style="App.TCheckbutton",
-            command=lambda: self._populate_achievements(popup),
+            command=self._refresh_achievements,
         ).pack(side="left")
-        ttk.Button(controls, text="Jump to first locked", style="Panel.TButton", command=lambda: self._populate_achievements(popup)).pack(side="right")
-        self._populate_achievements(popup)
+        ttk.Button(controls, text="Jump to first locked", style="Panel.TButton", command=self._refresh_achievements).pack(side="right")
+        self._build_achievements_widgets(popup)
+        self._refresh_achievements()
 
     def _close_achievements_popup(self, popup: tk.Toplevel) -> None:
-        try:
-            popup.destroy()
-        finally:
-            self.achievements_popup = None
+        # Hide rather than destroy so reopening skips widget construction.
+        popup.withdraw()
 
     def _save_history_now(self) -> None:
         if not self.session.history:
             self.status_var.set("No history to save yet.")
             return
-        path = game.save_session_history_to_file(
-            [(d, r, ts, 0.0) for d, r, ts in self.session.history], rotate=self.rotate_logs.get()
-        )
+        rows = [(d, r, ts, 0.0) for d, r, ts in self.session.history]
+        # The worker only does file I/O and its future returns the path written; completion is
+        # picked up on the Tk thread by polling, so no Tk call ever happens off the main thread.
+        future = self._io_executor.submit(game.save_session_history_to_file, rows, rotate=self.rotate_logs.get())
+        self.root.after(50, self._poll_history_save, future)
+
+    def _poll_history_save(self, future: concurrent.futures.Future) -> None:
+        if self._closing:
+            return
+        if not future.done():
+            self.root.after(50, self._poll_history_save, future)
+            return
+        try:
+            path = future.result()
+        except Exception as exc:  # save_session_history_to_file reports its own I/O errors; this is a backstop
+            self.status_var.set(f"Could not save history ({exc}).")
+            return
+        self._on_history_saved(path)
+
+    def _on_history_saved(self, path: str) -> None:
         self.session.last_history_path = path
         self.log_path_var.set(f"History file: {path}")
         self.status_var.set("History saved.")
@@ -1934,14 +2130,20 @@ class TicTacToeGUI:
             pass
 
     def _show_ai_vs_ai_popup(self) -> None:
-        if self.ai_vs_ai_popup and self.ai_vs_ai_popup.winfo_exists():
-            self.ai_vs_ai_popup.lift()
-            self.ai_vs_ai_popup.focus_set()
+        existing = self.ai_vs_ai_popup
+        if existing and existing.winfo_exists():
+            # Reuse the hidden window instead of rebuilding its widget tree.
+            if existing.state() == "withdrawn":
+                existing.deiconify()
+                self._load_ai_scores_into_log()
+            existing.lift()
+            existing.focus_set()
             return
 
         popup = tk.Toplevel(self.root)
         popup.title("AI vs AI Mode")
         popup.configure(bg=self._color("BG"))
+        popup.protocol("WM_DELETE_WINDOW", lambda: self._close_ai_vs_ai_popup(popup))
         self.ai_vs_ai_popup = popup
         frame = ttk.Frame(popup, padding=12, style="App.TFrame")
         frame.grid(row=0, column=0, sticky="nsew")
@@ -1950,7 +2152,7 @@ class TicTacToeGUI:
 
         ttk.Label(frame, text="AI vs AI", style="Title.TLabel").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
 
-        ai_names = list(ai_vs_ai.AI_PLAYERS.keys())
+        ai_names = _AI_NAMES
         self.ai_x_var = tk.StringVar(value=ai_names[0])
         self.ai_o_var = tk.StringVar(value=ai_names[min(1, len(ai_names) - 1)])
         self.ai_rounds_var = tk.StringVar(value="5")
@@ -1997,6 +2199,7 @@ class TicTacToeGUI:
                 lbl.grid(row=r, column=c, padx=4, pady=4, sticky="nsew")
                 row_labels.append(lbl)
             self.ai_board_labels.append(row_labels)
+        self._ai_labels_flat = tuple(lbl for row in self.ai_board_labels for lbl in row)
 
         ttk.Label(frame, text="Results", style="Title.TLabel").grid(row=8, column=0, columnspan=2, sticky="w", pady=(8, 4))
         self.ai_log = tk.Text(frame, height=10, wrap="word", bg=self._color("PANEL"), fg=self._color("TEXT"), relief="flat")
@@ -2006,26 +2209,46 @@ class TicTacToeGUI:
 
         self._load_ai_scores_into_log()
 
+    def _restyle_ai_vs_ai_popup(self) -> None:
+        accent, o_color = self._color("ACCENT"), self._color("O")
+        if hasattr(self, "_ai_label_fg"):
+            self._ai_label_fg = {"X": accent, "O": o_color}
+        piece_fg = {"X": accent, "O": o_color}
+        cell_bg, text_fg, board_font = self._color("CELL"), self._color("TEXT"), self._font("board")
+        for lbl in self._ai_labels_flat:
+            lbl.configure(bg=cell_bg, fg=piece_fg.get(lbl.cget("text"), text_fg), font=board_font)
+        self.ai_log.configure(bg=self._color("PANEL"), fg=text_fg, insertbackground=text_fg)
+
     def _load_ai_scores_into_log(self) -> None:
         if not hasattr(self, "ai_log"):
             return
-        scores = ai_vs_ai.load_ai_scoreboard()
+        scores = self._get_ai_scores()
         self.ai_log.delete("1.0", tk.END)
-        self.ai_log.insert(tk.END, "Current AI-vs-AI scores:\n")
+        buf = ["Current AI-vs-AI scores:\n"]
         if scores:
-            for name, val in sorted(scores.items()):
-                self.ai_log.insert(tk.END, f"- {name}: {val}\n")
+            buf.extend(f"- {name}: {val}\n" for name, val in sorted(scores.items()))
         else:
-            self.ai_log.insert(tk.END, "(empty)\n")
+            buf.append("(empty)\n")
+        self.ai_log.insert(tk.END, "".join(buf))
         self.ai_log.see(tk.END)
         self._reset_ai_board_ui()
 
+    def _get_ai_scores(self) -> dict[str, int]:
+        if self._ai_scores_cache is None:
+            self._ai_scores_cache = ai_vs_ai.load_ai_scoreboard()
+        return self._ai_scores_cache
+
+    def _save_ai_scores(self, scores: dict[str, int]) -> None:
+        self._ai_scores_cache = dict(scores)
+        ai_vs_ai.save_ai_scoreboard(scores)
+
     def _reset_ai_board_ui(self) -> None:
         self.ai_board = [" "] * 9
-        for r in range(3):
-            for c in range(3):
-                lbl = self.ai_board_labels[r][c]
-                lbl.configure(text=" ", bg=self._color("CELL"), fg=self._color("TEXT"))
+        # Free AI-vs-AI cells as a 9-bit mask, cleared as moves land.
+        self.ai_open_mask = game.FULL_MASK
+        cell_bg, text_fg = self._color("CELL"), self._color("TEXT")
+        for lbl in self._ai_labels_flat:
+            lbl.configure(text=" ", bg=cell_bg, fg=text_fg)
 
     def _run_ai_vs_ai(self) -> None:
         if not hasattr(self, "ai_log"):
@@ -2053,19 +2276,24 @@ class TicTacToeGUI:
         if not ai_x_fn or not ai_o_fn:
             messagebox.showerror("AI selection", "Please select valid AIs for X and O.")
             return
+        ai_x_fn = _CACHED_AI_MOVES.get(ai_x_fn, ai_x_fn)
+        ai_o_fn = _CACHED_AI_MOVES.get(ai_o_fn, ai_o_fn)
 
         self.ai_log.insert(tk.END, f"\nRunning {rounds} rounds: X={ai_x_name} vs O={ai_o_name} | {delay_sec:.0f}s per move\n")
         self.ai_log.see(tk.END)
-        self.root.update_idletasks()
 
         self.ai_running = True
         self.ai_start_btn.state(["disabled"])
-        self.ai_scores = ai_vs_ai.load_ai_scoreboard()
+        # Copy so an abandoned match never leaks partial tallies into the cache.
+        self.ai_scores = dict(self._get_ai_scores())
         self.ai_scores.setdefault(ai_x_name, 0)
         self.ai_scores.setdefault(ai_o_name, 0)
         self.ai_scores.setdefault("Draw", 0)
         self.ai_x_name = ai_x_name
         self.ai_o_name = ai_o_name
+        # Per-match lookups for _step_ai_turn: scoreboard key and label colour by symbol/result.
+        self._ai_score_keys = {"X": ai_x_name, "O": ai_o_name, "Draw": "Draw"}
+        self._ai_label_fg = {"X": self._color("ACCENT"), "O": self._color("O")}
         self.ai_x_fn = ai_x_fn
         self.ai_o_fn = ai_o_fn
         self.ai_total_rounds = rounds
@@ -2076,30 +2304,28 @@ class TicTacToeGUI:
         self._start_ai_round()
 
     def _close_ai_vs_ai_popup(self, popup: tk.Toplevel) -> None:
-        try:
-            popup.destroy()
-        finally:
-            self.ai_vs_ai_popup = None
-            self.ai_log = None
-            self.ai_running = False
-            self.ai_paused = False
-            self.ai_board = [" "] * 9
+        # Hide rather than destroy so reopening skips widget construction; stop any running match.
+        popup.withdraw()
+        self.ai_running = False
+        self.ai_paused = False
+        self.ai_board = [" "] * 9
+        self.ai_open_mask = game.FULL_MASK
+        self.ai_start_btn.state(["!disabled"])
 
     def _start_ai_round(self) -> None:
         if not getattr(self, "ai_running", False):
             return
         if getattr(self, "ai_paused", False):
-            self.root.after(self.ai_delay_ms, self._start_ai_round)
+            self._defer(self.ai_delay_ms, self._start_ai_round)
             return
         if self.ai_current_round > self.ai_total_rounds:
-            ai_vs_ai.save_ai_scoreboard(self.ai_scores)
-            self.ai_log.insert(
-                tk.END,
+            self._save_ai_scores(self.ai_scores)
+            buf = [
                 f"\nSession complete. X wins: {self.ai_x_wins}, O wins: {self.ai_o_wins}, Draws: {self.ai_draws}\n",
-            )
-            self.ai_log.insert(tk.END, "Updated scores:\n")
-            for name, val in sorted(self.ai_scores.items()):
-                self.ai_log.insert(tk.END, f"- {name}: {val}\n")
+                "Updated scores:\n",
+            ]
+            buf.extend(f"- {name}: {val}\n" for name, val in sorted(self.ai_scores.items()))
+            self.ai_log.insert(tk.END, "".join(buf))
             self.ai_log.see(tk.END)
             self.ai_running = False
             self.ai_start_btn.state(["!disabled"])
@@ -2108,66 +2334,59 @@ class TicTacToeGUI:
         self._reset_ai_board_ui()
         self.ai_log.insert(tk.END, f"\nRound {self.ai_current_round} start\n")
         self.ai_log.see(tk.END)
-        self.root.update_idletasks()
 
         self.ai_turn = "X"
-        self.root.after(self.ai_delay_ms, self._step_ai_turn)
+        self._defer(self.ai_delay_ms, self._step_ai_turn)
 
     def _step_ai_turn(self) -> None:
         if not getattr(self, "ai_running", False):
             return
         if getattr(self, "ai_paused", False):
-            self.root.after(self.ai_delay_ms, self._step_ai_turn)
+            self._defer(self.ai_delay_ms, self._step_ai_turn)
             return
 
         board = self.ai_board
         current = self.ai_turn
         fn = self.ai_x_fn if current == "X" else self.ai_o_fn
         idx = fn(board)
+        open_mask = self.ai_open_mask
         if board[idx] != " ":
-            open_spots = [i for i, v in enumerate(board) if v == " "]
-            if not open_spots:
-                idx = None
-            else:
-                idx = open_spots[0]
+            # Fall back to the lowest free cell.
+            idx = (open_mask & -open_mask).bit_length() - 1 if open_mask else None
         if idx is None:
             winner = "Draw"
         else:
             board[idx] = current
-            r, c = divmod(idx, 3)
-            lbl = self.ai_board_labels[r][c]
-            lbl.configure(text=current, fg=self._color("ACCENT") if current == "X" else self._color("O"))
-            winner = game.check_winner(board)
-            if winner is None and game.board_full(board):
-                winner = "Draw"
+            self.ai_open_mask = open_mask & ~(1 << idx)
+            lbl = self._ai_labels_flat[idx]
+            lbl.configure(text=current, fg=self._ai_label_fg[current])
+            winner = game.check_terminal(board)
 
         if winner:
+            self.ai_scores[self._ai_score_keys[winner]] += 1
             if winner == "X":
-                self.ai_scores[self.ai_x_name] += 1
                 self.ai_x_wins += 1
                 self.ai_log.insert(tk.END, f"Round {self.ai_current_round}: X ({self.ai_x_name}) wins.\n")
             elif winner == "O":
-                self.ai_scores[self.ai_o_name] += 1
                 self.ai_o_wins += 1
                 self.ai_log.insert(tk.END, f"Round {self.ai_current_round}: O ({self.ai_o_name}) wins.\n")
             else:
-                self.ai_scores["Draw"] = self.ai_scores.get("Draw", 0) + 1
                 self.ai_draws += 1
                 self.ai_log.insert(tk.END, f"Round {self.ai_current_round}: Draw.\n")
             self.ai_log.see(tk.END)
             self.ai_current_round += 1
-            self.root.after(self.ai_delay_ms, self._start_ai_round)
+            self._defer(self.ai_delay_ms, self._start_ai_round)
             return
 
         self.ai_turn = "O" if current == "X" else "X"
-        self.root.after(self.ai_delay_ms, self._step_ai_turn)
+        self._defer(self.ai_delay_ms, self._step_ai_turn)
 
     def _toggle_ai_pause(self) -> None:
         if not getattr(self, "ai_running", False):
             return
         self.ai_paused = not getattr(self, "ai_paused", False)
         if not self.ai_paused:
-            self.root.after(0, self._step_ai_turn)
+            self._defer(0, self._step_ai_turn)
 
     def _show_options_popup(self) -> None:
         options.show_options_popup(self)
@@ -9,28 +9,31 @@ if str(PROJECT_ROOT) not in sys.path:
 from shared import options as shared_options
 
 
+# (label, BooleanVar attribute, callback attribute); the shared builder resolves names on the gui.
+_TOGGLES = (
+    ("Require confirmations", "confirm_moves", "_toggle_confirm"),
+    ("Auto-start next game", "auto_start", "_toggle_auto_start"),
+    ("Larger fonts", "large_fonts", "_toggle_font_size"),
+    ("Animations", "animations_enabled", "_toggle_animations"),
+    ("Sound cues", "sound_enabled", "_toggle_sound"),
+    ("Show board coordinates", "show_coords", "_toggle_show_coords"),
+    ("Show AI heatmap", "show_heatmap", "_toggle_heatmap"),
+    ("Show welcome overlay at launch", "show_intro_overlay", "_schedule_save"),
+    ("Human-like Normal AI (occasional mistakes)", "humanish_normal", "_schedule_save"),
+    ("AI commentary", "show_commentary", "_schedule_save"),
+)
+_PRESETS = (
+    ("No animation/sound preset", "_disable_motion_sound"),
+    ("Reset toggles to default", "_reset_toggles"),
+)
+
+
 def show_options_popup(gui) -> None:
     """Display the options popup using the shared builder so other games can reuse it."""
-    toggles = [
-        ("Require confirmations", gui.confirm_moves, gui._toggle_confirm),
-        ("Auto-start next game", gui.auto_start, gui._toggle_auto_start),
-        ("Larger fonts", gui.large_fonts, gui._toggle_font_size),
-        ("Animations", gui.animations_enabled, gui._toggle_animations),
-        ("Sound cues", gui.sound_enabled, gui._toggle_sound),
-        ("Show board coordinates", gui.show_coords, gui._toggle_show_coords),
-        ("Show AI heatmap", gui.show_heatmap, gui._toggle_heatmap),
-        ("Show welcome overlay at launch", gui.show_intro_overlay, gui._save_settings),
-        ("Human-like Normal AI (occasional mistakes)", gui.humanish_normal, gui._save_settings),
-        ("AI commentary", gui.show_commentary, gui._save_settings),
-    ]
-    presets = [
-        ("No animation/sound preset", gui._disable_motion_sound),
-        ("Reset toggles to default", gui._reset_toggles),
-    ]
     shared_options.show_options_popup(
         gui,
-        toggles=toggles,
-        preset_actions=presets,
+        toggles=_TOGGLES,
+        preset_actions=_PRESETS,
         title="Options",
         subtitle="Tweak visuals, sounds, and behavior to your liking.",
     )
@@ -551,23 +551,60 @@ def view_saved_history(file_path: Optional[str] = None) -> None:
         print(f"Could not read session history file ({exc}).")
 
 
+WIN_LINES: Tuple[Tuple[int, int, int], ...] = (
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+)
+# Same lines as 9-bit occupancy masks (bit i set for cell i).
+WIN_MASKS: Tuple[int, ...] = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WIN_LINES)
+FULL_MASK = 0x1FF
+
+
 def check_winner(board: List[str]) -> Optional[str]:
-    winning_lines = [
-        (0, 1, 2),
-        (3, 4, 5),
-        (6, 7, 8),
-        (0, 3, 6),
-        (1, 4, 7),
-        (2, 5, 8),
-        (0, 4, 8),
-        (2, 4, 6),
-    ]
-    for a, b, c in winning_lines:
+    for a, b, c in WIN_LINES:
         if board[a] == board[b] == board[c] and board[a] != " ":
             return board[a]
     return None
 
 
+def winner_from_bits(x_bits: int, o_bits: int) -> Optional[str]:
+    """Bitboard variant of :func:`check_winner` for callers tracking per-side occupancy masks."""
+    for mask in WIN_MASKS:
+        if x_bits & mask == mask:
+            return "X"
+        if o_bits & mask == mask:
+            return "O"
+    return None
+
+
+def win_line_from_bits(x_bits: int, o_bits: int) -> Optional[int]:
+    """Index into :data:`WIN_LINES` of the first completed line for either side, or None."""
+    for i, mask in enumerate(WIN_MASKS):
+        if x_bits & mask == mask or o_bits & mask == mask:
+            return i
+    return None
+
+
+def check_terminal(board: List[str]) -> Optional[str]:
+    """Winner ("X"/"O"), "Draw" for a full board, or None; one pass over ``board`` instead of check_winner + board_full."""
+    x_bits = o_bits = 0
+    for i, cell in enumerate(board):
+        if cell == "X":
+            x_bits |= 1 << i
+        elif cell == "O":
+            o_bits |= 1 << i
+    winner = winner_from_bits(x_bits, o_bits)
+    if winner is None and (x_bits | o_bits) == FULL_MASK:
+        return "Draw"
+    return winner
+
+
 def board_full(board: List[str]) -> bool:
     return all(cell != " " for cell in board)
 
@@ -745,23 +782,13 @@ def ai_move_normal_aggressive(board: List[str]) -> int:
 
 def find_fork_move(board: List[str], symbol: str) -> Optional[int]:
     """Return a move that creates two or more winning lines (a fork) for symbol."""
-    winning_lines = [
-        (0, 1, 2),
-        (3, 4, 5),
-        (6, 7, 8),
-        (0, 3, 6),
-        (1, 4, 7),
-        (2, 5, 8),
-        (0, 4, 8),
-        (2, 4, 6),
-    ]
     best: List[Tuple[int, int]] = []  # (two_way_count, idx)
     for idx in range(9):
         if board[idx] != " ":
             continue
         board[idx] = symbol
         two_way = 0
-        for a, b, c in winning_lines:
+        for a, b, c in WIN_LINES:
             line = (board[a], board[b], board[c])
             if line.count(symbol) == 2 and line.count(" ") == 1:
                 two_way += 1
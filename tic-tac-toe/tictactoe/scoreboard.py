@@ -163,7 +163,8 @@ def save_scoreboard(score: Dict[str, Dict[str, int]], file_path: str = SCOREBOAR
     fd, temp_path = tempfile.mkstemp(dir=dir_name, prefix=".scoreboard.", text=True)
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
+            # Encode up front and hand over one string; json.dump writes token by token.
+            f.write(json.dumps(payload))
         os.replace(temp_path, file_path)
     except (OSError, PermissionError) as exc:
         print(f"Could not save scoreboard ({exc}). Your latest results may not be persisted.")